@@ -17,45 +17,72 @@ depends_on = None
 
 
 def upgrade() -> None:
+    # Each table gets a single ALTER TABLE so its AccessExclusive lock is
+    # taken once rather than once per column.
+
     # Add local image URL fields to artwork table
-    op.add_column('artwork', sa.Column('local_image_url', sa.String(500), nullable=True))
-    op.add_column('artwork', sa.Column('local_thumbnail_url', sa.String(500), nullable=True))
-    op.add_column('artwork', sa.Column('storage_path', sa.String(500), nullable=True))
-    op.add_column('artwork', sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True))
-    op.add_column('artwork', sa.Column('file_size', sa.Integer(), nullable=True))
+    op.execute(sa.text(
+        "ALTER TABLE artwork "
+        "ADD COLUMN local_image_url VARCHAR(500) NULL, "
+        "ADD COLUMN local_thumbnail_url VARCHAR(500) NULL, "
+        "ADD COLUMN storage_path VARCHAR(500) NULL, "
+        "ADD COLUMN processed_at TIMESTAMPTZ NULL, "
+        "ADD COLUMN file_size INTEGER NULL"
+    ))
 
     # Add local image URL fields to series table
-    op.add_column('series', sa.Column('local_image_url', sa.String(500), nullable=True))
-    op.add_column('series', sa.Column('local_banner_url', sa.String(500), nullable=True))
-    op.add_column('series', sa.Column('local_poster_url', sa.String(500), nullable=True))
-    op.add_column('series', sa.Column('local_fanart_url', sa.String(500), nullable=True))
+    op.execute(sa.text(
+        "ALTER TABLE series "
+        "ADD COLUMN local_image_url VARCHAR(500) NULL, "
+        "ADD COLUMN local_banner_url VARCHAR(500) NULL, "
+        "ADD COLUMN local_poster_url VARCHAR(500) NULL, "
+        "ADD COLUMN local_fanart_url VARCHAR(500) NULL"
+    ))
 
     # Add local image URL fields to movies table
-    op.add_column('movies', sa.Column('local_image_url', sa.String(500), nullable=True))
-    op.add_column('movies', sa.Column('local_poster_url', sa.String(500), nullable=True))
-    op.add_column('movies', sa.Column('local_fanart_url', sa.String(500), nullable=True))
-    op.add_column('movies', sa.Column('local_banner_url', sa.String(500), nullable=True))
+    op.execute(sa.text(
+        "ALTER TABLE movies "
+        "ADD COLUMN local_image_url VARCHAR(500) NULL, "
+        "ADD COLUMN local_poster_url VARCHAR(500) NULL, "
+        "ADD COLUMN local_fanart_url VARCHAR(500) NULL, "
+        "ADD COLUMN local_banner_url VARCHAR(500) NULL"
+    ))
 
     # Add local image URL fields to episodes table
-    op.add_column('episodes', sa.Column('local_image_url', sa.String(500), nullable=True))
-    op.add_column('episodes', sa.Column('local_thumbnail_url', sa.String(500), nullable=True))
+    op.execute(sa.text(
+        "ALTER TABLE episodes "
+        "ADD COLUMN local_image_url VARCHAR(500) NULL, "
+        "ADD COLUMN local_thumbnail_url VARCHAR(500) NULL"
+    ))
 
     # Add local image URL fields to seasons table
-    op.add_column('seasons', sa.Column('local_image_url', sa.String(500), nullable=True))
-    op.add_column('seasons', sa.Column('local_poster_url', sa.String(500), nullable=True))
+    op.execute(sa.text(
+        "ALTER TABLE seasons "
+        "ADD COLUMN local_image_url VARCHAR(500) NULL, "
+        "ADD COLUMN local_poster_url VARCHAR(500) NULL"
+    ))
 
     # Add local image URL field to people table
-    op.add_column('people', sa.Column('local_image_url', sa.String(500), nullable=True))
+    op.execute(sa.text(
+        "ALTER TABLE people "
+        "ADD COLUMN local_image_url VARCHAR(500) NULL"
+    ))
 
-    # Create indexes for faster lookups
-    op.create_index('idx_artwork_local_image_url', 'artwork', ['local_image_url'])
-    op.create_index('idx_artwork_processed_at', 'artwork', ['processed_at'])
+    # Create indexes for faster lookups. CONCURRENTLY avoids blocking writes
+    # on artwork while the index builds, but cannot run inside a transaction.
+    # The local_image_url index is deferred to add_local_image_url_index, on
+    # the "deferred" branch, so it is not built over an all-NULL column
+    # before the image sync backfill.
+    with op.get_context().autocommit_block():
+        op.create_index('idx_artwork_processed_at', 'artwork', ['processed_at'],
+                        postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
     # Drop indexes
-    op.drop_index('idx_artwork_processed_at', 'artwork')
-    op.drop_index('idx_artwork_local_image_url', 'artwork')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_artwork_processed_at', 'artwork',
+                      postgresql_concurrently=True, if_exists=True)
 
     # Remove columns from people table
     op.drop_column('people', 'local_image_url')
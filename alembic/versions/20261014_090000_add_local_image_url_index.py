@@ -0,0 +1,37 @@
+"""Add deferred index on artwork.local_image_url
+
+This is a deferred migration on its own "deferred" branch, so
+``alembic upgrade main@head`` never builds it. Apply it once the image sync
+task has backfilled artwork.local_image_url:
+
+    alembic upgrade deferred@head
+
+Building it earlier indexes an all-NULL column and makes every backfill
+UPDATE pay for index maintenance.
+
+Revision ID: add_local_image_url_index
+Revises: add_local_image_urls
+Create Date: 2026-10-14 09:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_local_image_url_index'
+down_revision = 'add_local_image_urls'
+branch_labels = ('deferred',)
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('idx_artwork_local_image_url', 'artwork', ['local_image_url'],
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_artwork_local_image_url', 'artwork',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,35 @@
+"""Add trigram index on api_keys.name for substring search
+
+The admin key listing filters with ``name ILIKE '%term%'``; the leading
+wildcard rules out a b-tree, but a pg_trgm GIN index serves it directly.
+
+Revision ID: add_api_keys_name_trgm
+Revises: add_local_image_urls
+Create Date: 2026-10-14 09:15:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_api_keys_name_trgm'
+down_revision = 'add_local_image_urls'
+# Schema migrations; the deferred index migrations branch off separately
+branch_labels = ('main',)
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_api_keys_name_trgm "
+            "ON api_keys USING gin (name gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_api_keys_name_trgm")
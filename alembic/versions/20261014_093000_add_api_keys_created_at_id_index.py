@@ -0,0 +1,30 @@
+"""Add (created_at DESC, id DESC) index for keyset pagination of api_keys
+
+Revision ID: add_api_keys_created_at_id
+Revises: add_api_keys_name_trgm
+Create Date: 2026-10-14 09:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_api_keys_created_at_id'
+down_revision = 'add_api_keys_name_trgm'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('idx_api_keys_created_at_id', 'api_keys',
+                        [sa.text('created_at DESC'), sa.text('id DESC')],
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_api_keys_created_at_id', 'api_keys',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,42 @@
+"""Add full-text GIN indexes on series, movie and person names
+
+The search fallbacks match ``to_tsvector('simple', name)`` against a
+``plainto_tsquery``; an expression index on the same vector lets each match
+use a bitmap index scan instead of scanning the table.
+
+Revision ID: add_name_search_indexes
+Revises: add_api_keys_created_at_id
+Create Date: 2026-10-14 09:45:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_name_search_indexes'
+down_revision = 'add_api_keys_created_at_id'
+branch_labels = None
+depends_on = None
+
+# (index name, table) for each searchable entity
+NAME_SEARCH_INDEXES = (
+    ('idx_series_name_tsv', 'series'),
+    ('idx_movies_name_tsv', 'movies'),
+    ('idx_people_name_tsv', 'people'),
+)
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for index_name, table in NAME_SEARCH_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                f"ON {table} USING gin (to_tsvector('simple'::regconfig, name))"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, _ in NAME_SEARCH_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
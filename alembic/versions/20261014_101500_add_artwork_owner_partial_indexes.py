@@ -0,0 +1,43 @@
+"""Replace artwork owner column indexes with partial (owner, type, primary) indexes
+
+Each artwork row sets only one of its five owner columns, so the single-column
+indexes mostly indexed NULLs. One partial index per owner, restricted to rows
+where it is set, also covers lookups by artwork type and primary flag.
+
+Revision ID: add_artwork_owner_partial_indexes
+Revises: add_name_search_indexes
+Create Date: 2026-10-14 10:15:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_artwork_owner_partial_indexes'
+down_revision = 'add_name_search_indexes'
+branch_labels = None
+depends_on = None
+
+OWNER_COLUMNS = ('series_id', 'season_id', 'episode_id', 'movie_id', 'person_id')
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for column in OWNER_COLUMNS:
+            op.create_index(f'idx_artwork_{column}_type_primary', 'artwork',
+                            [column, 'type_id', 'is_primary'],
+                            postgresql_where=sa.text(f'{column} IS NOT NULL'),
+                            postgresql_concurrently=True, if_not_exists=True)
+            op.drop_index(f'ix_artwork_{column}', 'artwork',
+                          postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in OWNER_COLUMNS:
+            op.create_index(f'ix_artwork_{column}', 'artwork', [column],
+                            postgresql_concurrently=True, if_not_exists=True)
+            op.drop_index(f'idx_artwork_{column}_type_primary', 'artwork',
+                          postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,47 @@
+"""Move counter and flag column defaults from Python to the server
+
+The models now declare these defaults as server_default, so inserts leave the
+columns out and Postgres fills them in; existing tables get the same defaults.
+SET DEFAULT only touches the catalog and does not rewrite the table.
+
+Revision ID: add_server_defaults
+Revises: add_artwork_owner_partial_indexes
+Create Date: 2026-10-14 10:30:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_server_defaults'
+down_revision = 'add_artwork_owner_partial_indexes'
+branch_labels = None
+depends_on = None
+
+# (table, column, default) for every column given a server default
+SERVER_DEFAULTS = (
+    ('api_keys', 'active', 'true'),
+    ('api_keys', 'rate_limit', '100'),
+    ('api_keys', 'total_requests', '0'),
+    ('api_keys', 'requires_pin', 'false'),
+    ('artwork', 'score', '0'),
+    ('artwork', 'is_primary', 'false'),
+    ('artwork', 'include_text', 'true'),
+    ('characters', 'is_featured', 'false'),
+    ('characters', 'needs_full_sync', 'false'),
+    ('episodes', 'needs_full_sync', 'false'),
+    ('movies', 'needs_full_sync', 'false'),
+    ('people', 'needs_full_sync', 'false'),
+    ('seasons', 'needs_full_sync', 'false'),
+    ('series', 'needs_full_sync', 'false'),
+)
+
+
+def upgrade() -> None:
+    for table, column, default in SERVER_DEFAULTS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT {default}")
+
+
+def downgrade() -> None:
+    for table, column, _ in SERVER_DEFAULTS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
@@ -0,0 +1,44 @@
+"""Add GIN indexes on series/season translations and series tags
+
+Containment (@>) filters on these columns otherwise scan the whole table.
+The JSONB indexes use jsonb_path_ops, which only supports @> but is about
+half the size of the default operator class.
+
+Revision ID: add_translation_gin_indexes
+Revises: add_server_defaults
+Create Date: 2026-10-14 10:45:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_translation_gin_indexes'
+down_revision = 'add_server_defaults'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_series_translations_gin', 'series', ['translations'],
+                        postgresql_using='gin',
+                        postgresql_ops={'translations': 'jsonb_path_ops'},
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_series_tags_gin', 'series', ['tags'],
+                        postgresql_using='gin',
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_seasons_translations_gin', 'seasons', ['translations'],
+                        postgresql_using='gin',
+                        postgresql_ops={'translations': 'jsonb_path_ops'},
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name in (('ix_seasons_translations_gin', 'seasons'),
+                                       ('ix_series_tags_gin', 'series'),
+                                       ('ix_series_translations_gin', 'series')):
+            op.drop_index(index_name, table_name,
+                          postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,48 @@
+"""Store TVDB artwork URLs without the shared artwork host
+
+Existing rows are rewritten to keep only the path after
+https://artworks.thetvdb.com; the TVDBImageUrl column type adds it back on
+read. URLs on other hosts are left as they are.
+
+Revision ID: strip_artwork_host_from_image_urls
+Revises: add_translation_gin_indexes
+Create Date: 2026-10-14 11:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'strip_artwork_host_from_image_urls'
+down_revision = 'add_translation_gin_indexes'
+branch_labels = None
+depends_on = None
+
+ARTWORK_HOST = 'https://artworks.thetvdb.com'
+
+IMAGE_URL_COLUMNS = {
+    'series': ('image', 'banner', 'poster', 'fanart'),
+    'seasons': ('image', 'poster'),
+    'movies': ('image', 'poster', 'fanart', 'banner'),
+    'episodes': ('image', 'thumbnail'),
+    'people': ('image',),
+    'artwork': ('image_url', 'thumbnail_url'),
+}
+
+
+def upgrade() -> None:
+    for table, columns in IMAGE_URL_COLUMNS.items():
+        for column in columns:
+            op.execute(
+                f"UPDATE {table} SET {column} = substr({column}, {len(ARTWORK_HOST) + 1}) "
+                f"WHERE {column} LIKE '{ARTWORK_HOST}/%'"
+            )
+
+
+def downgrade() -> None:
+    for table, columns in IMAGE_URL_COLUMNS.items():
+        for column in columns:
+            op.execute(
+                f"UPDATE {table} SET {column} = '{ARTWORK_HOST}' || {column} "
+                f"WHERE {column} LIKE '/%'"
+            )
@@ -0,0 +1,40 @@
+"""Replace season series_id/number indexes with one (series_id, number) index
+
+Season-N-of-series-S lookups were served by combining the two single-column
+indexes. The composite index answers them directly and, through its leading
+column, every series_id lookup too. It is not unique: different season
+orderings of a series reuse the same numbers.
+
+Revision ID: add_season_series_number_index
+Revises: strip_artwork_host_from_image_urls
+Create Date: 2026-10-14 11:15:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_season_series_number_index'
+down_revision = 'strip_artwork_host_from_image_urls'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_seasons_series_id_number', 'seasons', ['series_id', 'number'],
+                        postgresql_concurrently=True, if_not_exists=True)
+        for index_name in ('ix_seasons_series_id', 'ix_seasons_number'):
+            op.drop_index(index_name, 'seasons',
+                          postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_seasons_series_id', 'seasons', ['series_id'],
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_seasons_number', 'seasons', ['number'],
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_seasons_series_id_number', 'seasons',
+                      postgresql_concurrently=True, if_exists=True)
@@ -1,14 +1,16 @@
+import base64
+import hashlib
 from datetime import datetime
 from typing import Optional
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from sqlalchemy import desc, func
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import desc, func, lambda_stmt, select, tuple_, update
 from sqlalchemy.orm import Session
 
-from app.auth import get_current_client
+from app.api.utils.rate_limit import limiter
+from app.auth import forget_client, get_current_client
 from app.database import get_db
 from app.models import ApiKey
 from app.schemas.api_key import (ApiKeyCreate, ApiKeyList, ApiKeyResponse,
@@ -18,7 +20,6 @@ from app.schemas.api_key import (ApiKeyCreate, ApiKeyList, ApiKeyResponse,
 logger = structlog.get_logger()
 
 router = APIRouter()
-limiter = Limiter(key_func=get_remote_address)
 
 # Admin authentication - for now, use a special admin key
 ADMIN_API_KEYS = {
@@ -29,12 +30,53 @@ ADMIN_API_KEYS = {
 }
 
 
+def _hash_admin_key(key: str) -> bytes:
+    """SHA-256 digest of an admin key, used for membership checks"""
+    return hashlib.sha256(key.encode()).digest()
+
+
+# Digests of the admin keys for the per-request check, so presented keys are
+# never compared against the plaintext values
+_ADMIN_KEY_HASHES = frozenset(_hash_admin_key(key) for key in ADMIN_API_KEYS)
+
+# Columns for read-only key listings, shaped to match ApiKeyResponse so rows
+# can be fed straight in without building ORM objects
+_API_KEY_LIST_COLUMNS = (
+    ApiKey.id,
+    ApiKey.name,
+    ApiKey.description,
+    ApiKey.active,
+    ApiKey.rate_limit,
+    func.concat("...", func.right(ApiKey.key, 4)).label("key_preview"),
+    ApiKey.last_used,
+    ApiKey.total_requests,
+    ApiKey.expires_at,
+    ApiKey.created_by,
+    ApiKey.created_at,
+    ApiKey.updated_at,
+    ApiKey.requires_pin,
+    (func.coalesce(ApiKey.pin, "") != "").label("has_pin"),
+)
+
+# Fixed-shape statements for the usage stats endpoint, built once
+_STATS_STMT = lambda_stmt(lambda: select(
+    func.count(),
+    func.count().filter(ApiKey.active),
+    func.count().filter(ApiKey.is_expired),
+    func.coalesce(func.sum(ApiKey.total_requests), 0),
+).select_from(ApiKey))
+
+_TOP_KEYS_STMT = lambda_stmt(lambda: select(
+    ApiKey.id, ApiKey.name, ApiKey.total_requests, ApiKey.last_used
+).order_by(desc(ApiKey.total_requests)).limit(5))
+
+
 def verify_admin_access(
         current_client: dict = Depends(get_current_client)) -> dict:
     """Verify that the current client has admin access"""
     api_key = current_client.get("api_key") or current_client.get("sub")
 
-    if api_key not in ADMIN_API_KEYS:
+    if not api_key or _hash_admin_key(api_key) not in _ADMIN_KEY_HASHES:
         raise HTTPException(
             status_code=403,
             detail="Admin access required"
@@ -43,6 +85,22 @@ def verify_admin_access(
     return current_client
 
 
+def _encode_cursor(row) -> str:
+    """Encode the (created_at, id) position of a listed key as a cursor"""
+    raw = f"{row['created_at'].isoformat()}|{row['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a list cursor back into its (created_at, id) position"""
+    try:
+        created_at, key_id = base64.urlsafe_b64decode(
+            cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(key_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
 @router.post("/api-keys", response_model=ApiKeyWithKey)
 @limiter.limit("10/minute")
 async def create_api_key(
@@ -100,12 +158,14 @@ async def create_api_key(
         ) from e
 
 
-@router.get("/api-keys", response_model=ApiKeyList)
+@router.get("/api-keys", response_model=ApiKeyList, response_class=ORJSONResponse)
 @limiter.limit("30/minute")
 async def list_api_keys(
     request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from a previous response's next_cursor"),
     active_only: bool = Query(False, description="Show only active keys"),
     search: Optional[str] = Query(None, description="Search by name"),
     admin: dict = Depends(verify_admin_access),
@@ -114,42 +174,76 @@ async def list_api_keys(
     """
     List all API keys with pagination
 
-    Admin access required. Never returns the actual API keys.
+    Admin access required. Never returns the actual API keys. Pass the
+    returned next_cursor to seek to the following page instead of using
+    deep page offsets.
     """
+    after = _decode_cursor(cursor) if cursor else None
+
     try:
         logger.info(
             "Listing API keys",
             page=page,
             per_page=per_page,
+            cursor=bool(cursor),
             admin=admin.get("client_name"))
 
-        # Build query
-        query = db.query(ApiKey)
+        # Build the page query and the total count in one round-trip. The
+        # lambda statements are cached per filter combination, so only the
+        # bound values change between requests.
+        offset = 0 if after else (page - 1) * per_page
+        stmt = lambda_stmt(
+            lambda: select(*_API_KEY_LIST_COLUMNS, func.count().over().label("total")))
+        count_stmt = lambda_stmt(lambda: select(func.count()).select_from(ApiKey))
 
         if active_only:
-            query = query.filter(ApiKey.active)
+            stmt += lambda s: s.where(ApiKey.active)
+            count_stmt += lambda s: s.where(ApiKey.active)
 
         if search:
-            query = query.filter(ApiKey.name.ilike(f"%{search}%"))
-
-        # Get total count
-        total = query.count()
-
-        # Apply pagination
-        offset = (page - 1) * per_page
-        keys = query.order_by(desc(ApiKey.created_at)).offset(
-            offset).limit(per_page).all()
-
-        # Convert to response format
-        key_responses = [ApiKeyResponse(**key.to_dict()) for key in keys]
+            pattern = f"%{search}%"
+            stmt += lambda s: s.where(ApiKey.name.ilike(pattern))
+            count_stmt += lambda s: s.where(ApiKey.name.ilike(pattern))
+
+        if after:
+            # Seek past the cursor row instead of scanning and discarding rows
+            after_created_at, after_id = after
+            stmt += lambda s: s.where(
+                tuple_(ApiKey.created_at, ApiKey.id) < tuple_(after_created_at, after_id))
+
+        stmt += lambda s: s.order_by(
+            desc(ApiKey.created_at), desc(ApiKey.id)).offset(offset).limit(per_page)
+        rows = db.execute(stmt).mappings().all()
+
+        if after:
+            # The window counts only rows after the cursor
+            remaining = rows[0]["total"] if rows else 0
+            total = db.execute(count_stmt).scalar_one()
+            has_next = remaining > per_page
+            has_prev = True
+        else:
+            if rows:
+                total = rows[0]["total"]
+            elif offset:
+                # Past the last page the window yields no rows to read it from
+                total = db.execute(count_stmt).scalar_one()
+            else:
+                total = 0
+            has_next = (offset + per_page) < total
+            has_prev = page > 1
+
+        # Rows are already shaped and typed by _API_KEY_LIST_COLUMNS, so skip
+        # re-validation (the extra "total" column is dropped)
+        key_responses = [ApiKeyResponse.model_construct(**row) for row in rows]
 
         return ApiKeyList(
             keys=key_responses,
             total=total,
             page=page,
             per_page=per_page,
-            has_next=(offset + per_page) < total,
-            has_prev=page > 1
+            has_next=has_next,
+            has_prev=has_prev,
+            next_cursor=_encode_cursor(rows[-1]) if has_next and rows else None
         )
 
     except Exception as e:
@@ -174,7 +268,7 @@ async def get_api_key(
     Admin access required. Does not return the actual API key.
     """
     try:
-        db_key = db.query(ApiKey).filter(ApiKey.id == key_id).first()
+        db_key = db.get(ApiKey, key_id)
 
         if not db_key:
             raise HTTPException(
@@ -214,7 +308,7 @@ async def update_api_key(
     Admin access required. Cannot update the actual key value.
     """
     try:
-        db_key = db.query(ApiKey).filter(ApiKey.id == key_id).first()
+        db_key = db.get(ApiKey, key_id)
 
         if not db_key:
             raise HTTPException(
@@ -223,12 +317,13 @@ async def update_api_key(
             )
 
         # Update only provided fields
-        update_data = key_data.dict(exclude_unset=True)
+        update_data = key_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_key, field, value)
 
         db.commit()
         db.refresh(db_key)
+        forget_client(db_key.key)
 
         logger.info("API key updated successfully",
                     key_id=key_id,
@@ -262,7 +357,7 @@ async def delete_api_key(
     Admin access required. This action is irreversible.
     """
     try:
-        db_key = db.query(ApiKey).filter(ApiKey.id == key_id).first()
+        db_key = db.get(ApiKey, key_id)
 
         if not db_key:
             raise HTTPException(
@@ -271,8 +366,10 @@ async def delete_api_key(
             )
 
         key_name = db_key.name
+        key_value = db_key.key
         db.delete(db_key)
         db.commit()
+        forget_client(key_value)
 
         logger.info("API key deleted successfully",
                     key_id=key_id,
@@ -306,31 +403,47 @@ async def rotate_api_key(
     Admin access required. Returns the new key value only once.
     """
     try:
-        db_key = db.query(ApiKey).filter(ApiKey.id == key_id).first()
+        new_key = ApiKey.generate_key()
 
-        if not db_key:
+        # Swap the key and reset usage in a single UPDATE ... RETURNING; the
+        # locked subquery supplies the previous key for the preview
+        old = (
+            select(ApiKey.id, ApiKey.key)
+            .where(ApiKey.id == key_id)
+            .with_for_update()
+            .subquery("old")
+        )
+        row = db.execute(
+            update(ApiKey)
+            .where(ApiKey.id == old.c.id)
+            .values(
+                key=new_key,
+                total_requests=0,  # Reset request count
+                last_used=None,    # Reset last used
+            )
+            .returning(ApiKey.id, ApiKey.name, old.c.key.label("old_key"))
+            .execution_options(synchronize_session=False)
+        ).one_or_none()
+
+        if not row:
             raise HTTPException(
                 status_code=404,
                 detail="API key not found"
             )
 
-        old_key_preview = f"...{db_key.key[-4:]}"
-        new_key = ApiKey.generate_key()
-
-        db_key.key = new_key
-        db_key.total_requests = 0  # Reset request count
-        db_key.last_used = None    # Reset last used
-
         db.commit()
+        forget_client(row.old_key)
+
+        old_key_preview = f"...{row.old_key[-4:]}"
 
         logger.info("API key rotated successfully",
                     key_id=key_id,
-                    key_name=db_key.name,
+                    key_name=row.name,
                     admin=admin.get("client_name"))
 
         return ApiKeyRotateResponse(
-            id=db_key.id,
-            name=db_key.name,
+            id=row.id,
+            name=row.name,
             old_key_preview=old_key_preview,
             new_key=new_key,
             message="API key rotated successfully. Update your applications with the new key."
@@ -347,7 +460,8 @@ async def rotate_api_key(
         ) from e
 
 
-@router.get("/api-keys/stats/usage", response_model=ApiKeyUsageStats)
+@router.get("/api-keys/stats/usage", response_model=ApiKeyUsageStats,
+            response_class=ORJSONResponse)
 @limiter.limit("10/minute")
 async def get_api_key_stats(
     request: Request,
@@ -360,34 +474,23 @@ async def get_api_key_stats(
     Admin access required.
     """
     try:
-        total_keys = db.query(ApiKey).count()
-        active_keys = db.query(ApiKey).filter(ApiKey.active).count()
+        # Key counts and total requests across all keys in one round-trip
+        total_keys, active_keys, expired_keys, total_requests = db.execute(_STATS_STMT).one()
         inactive_keys = total_keys - active_keys
 
-        # Count expired keys
-        expired_keys = db.query(ApiKey).filter(
-            ApiKey.expires_at < datetime.utcnow()
-        ).count()
-
-        # Total requests across all keys
-        total_requests_result = db.query(
-            func.sum(ApiKey.total_requests)).scalar()
-        total_requests = total_requests_result or 0
-
         # Average requests per key
         avg_requests = total_requests / total_keys if total_keys > 0 else 0
 
         # Top 5 most used keys
-        top_keys_query = db.query(ApiKey).order_by(
-            desc(ApiKey.total_requests)).limit(5)
+        top_keys_rows = db.execute(_TOP_KEYS_STMT).mappings().all()
         top_keys = [
             {
-                "id": key.id,
-                "name": key.name,
-                "total_requests": key.total_requests,
-                "last_used": key.last_used.isoformat() if key.last_used else None
+                "id": row["id"],
+                "name": row["name"],
+                "total_requests": row["total_requests"],
+                "last_used": row["last_used"].isoformat() if row["last_used"] else None
             }
-            for key in top_keys_query.all()
+            for row in top_keys_rows
         ]
 
         logger.info("API key stats retrieved", admin=admin.get("client_name"))
@@ -1,8 +1,10 @@
 """Admin endpoints for managing synchronization and images."""
+import asyncio
 from typing import Optional
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.auth import require_admin
@@ -16,6 +18,8 @@ logger = structlog.get_logger()
 
 router = APIRouter()
 
+_VALID_ENTITY_TYPES = frozenset({"series", "movie", "episode", "person", "season"})
+
 
 @router.post("/sync/images/{entity_type}/{entity_id}")
 async def sync_entity_images(
@@ -33,14 +37,13 @@ async def sync_entity_images(
     Returns:
         Task information
     """
-    valid_types = ["series", "movie", "episode", "person", "season"]
-    if entity_type not in valid_types:
+    if entity_type not in _VALID_ENTITY_TYPES:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid entity type. Must be one of: {valid_types}")
+            detail=f"Invalid entity type. Must be one of: {sorted(_VALID_ENTITY_TYPES)}")
 
     try:
-        task = sync_content_images.delay(entity_type, entity_id)
+        task = await asyncio.to_thread(sync_content_images.delay, entity_type, entity_id)
 
         logger.info(
             "Image sync task queued",
@@ -80,13 +83,13 @@ async def sync_missing_images(
         raise HTTPException(status_code=400, detail="Limit cannot exceed 1000")
 
     if entity_type:
-        valid_types = ["series", "movie", "episode", "person", "season"]
-        if entity_type not in valid_types:
-            raise HTTPException(status_code=400,
-                                detail=f"Invalid entity type. Must be one of: {valid_types}")
+        if entity_type not in _VALID_ENTITY_TYPES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid entity type. Must be one of: {sorted(_VALID_ENTITY_TYPES)}")
 
     try:
-        task = sync_all_missing_images.delay(entity_type, limit)
+        task = await asyncio.to_thread(sync_all_missing_images.delay, entity_type, limit)
 
         logger.info(
             "Missing images sync task queued",
@@ -124,7 +127,7 @@ async def cleanup_images(
         Task information
     """
     try:
-        task = cleanup_orphaned_images.delay()
+        task = await asyncio.to_thread(cleanup_orphaned_images.delay)
 
         logger.info(
             "Image cleanup task queued",
@@ -155,7 +158,7 @@ async def trigger_full_sync(
         Task information
     """
     try:
-        task = full_sync.delay()
+        task = await asyncio.to_thread(full_sync.delay)
 
         logger.info(
             "Full sync task queued",
@@ -186,7 +189,7 @@ async def trigger_incremental_sync(
         Task information
     """
     try:
-        task = incremental_sync.delay()
+        task = await asyncio.to_thread(incremental_sync.delay)
 
         logger.info(
             "Incremental sync task queued",
@@ -219,7 +222,7 @@ async def sync_series(
         Task information
     """
     try:
-        task = sync_series_detailed.delay(series_id)
+        task = await asyncio.to_thread(sync_series_detailed.delay, series_id)
 
         logger.info(
             "Series sync task queued",
@@ -240,7 +243,7 @@ async def sync_series(
         raise HTTPException(status_code=500, detail="Failed to queue series sync task") from e
 
 
-@router.get("/tasks/{task_id}")
+@router.get("/tasks/{task_id}", response_class=ORJSONResponse)
 async def get_task_status(
     task_id: str,
     admin: dict = Depends(require_admin)
@@ -255,16 +258,20 @@ async def get_task_status(
     """
 
     try:
-        task = celery_app.AsyncResult(task_id)
+        # Read the whole task meta in one backend round-trip, off the event loop
+        meta = await asyncio.to_thread(celery_app.backend.get_task_meta, task_id)
+        state = meta.get("status")
+        info = meta.get("result")
+        progress = info if isinstance(info, dict) else {}
 
         return {
             "task_id": task_id,
-            "state": task.state,
-            "current": task.info.get("current", 0) if task.info else 0,
-            "total": task.info.get("total", 100) if task.info else 100,
-            "status": task.info.get("status", "") if task.info else "",
-            "result": task.result if task.state == "SUCCESS" else None,
-            "error": str(task.info) if task.state == "FAILURE" else None
+            "state": state,
+            "current": progress.get("current", 0),
+            "total": progress.get("total", 100),
+            "status": progress.get("status", ""),
+            "result": info if state == "SUCCESS" else None,
+            "error": str(info) if state == "FAILURE" else None
         }
 
     except Exception as e:
@@ -1,11 +1,18 @@
 """Image serving endpoints - TVDB API compliant."""
+from datetime import timezone
+from email.utils import format_datetime
 from typing import Optional
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Response
-from sqlalchemy.orm import Session
-
-from app.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
+
+from app.api.utils.conditional import is_not_modified
+from app.config import settings
+from app.database import get_async_db
 from app.models import Episode, Movie, Person, Series
 from app.services.image_service import image_service
 from app.services.storage import storage
@@ -14,13 +21,32 @@ logger = structlog.get_logger()
 
 router = APIRouter()
 
+VALID_ENTITY_TYPES = frozenset({"series", "movie", "episode", "person"})
+VALID_IMAGE_TYPES = frozenset({"poster", "banner", "fanart", "image", "thumbnail"})
+
+# TVDB source URL column for each (entity type, image type) we can fall back to
+_FALLBACK_URL_COLUMNS = {
+    ("series", "image"): Series.image,
+    ("series", "poster"): Series.poster,
+    ("series", "banner"): Series.banner,
+    ("series", "fanart"): Series.fanart,
+    ("movie", "image"): Movie.image,
+    ("movie", "poster"): Movie.poster,
+    ("movie", "banner"): Movie.banner,
+    ("movie", "fanart"): Movie.fanart,
+    ("episode", "image"): Episode.image,
+    ("episode", "thumbnail"): Episode.thumbnail,
+    ("person", "image"): Person.image,
+}
+
 
 @router.get("/{entity_type}/{entity_id}/{image_type}")
 async def get_image(
+    request: Request,
     entity_type: str,
     entity_id: int,
     image_type: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Serve raw image from storage with fallback to TVDB.
 
@@ -33,33 +59,60 @@ async def get_image(
         image_type: Type of image (poster, banner, fanart, image)
 
     Returns:
-        Raw image data with appropriate content type
+        Raw image data with appropriate content type, streamed from storage
+        or handed to the reverse proxy via X-Accel-Redirect when enabled
     """
     # Validate entity type
-    valid_entity_types = ["series", "movie", "episode", "person"]
-    if entity_type not in valid_entity_types:
+    if entity_type not in VALID_ENTITY_TYPES:
         raise HTTPException(status_code=404, detail="Invalid entity type")
 
     # Validate image type
-    valid_image_types = ["poster", "banner", "fanart", "image", "thumbnail"]
-    if image_type not in valid_image_types:
+    if image_type not in VALID_IMAGE_TYPES:
         raise HTTPException(status_code=404, detail="Invalid image type")
 
-    # Try to get image from storage
-    result = await image_service.get_image(entity_type, entity_id, image_type)
-
-    if result:
-        image_data, content_type = result
-
-        # Return image with caching headers
-        return Response(
-            content=image_data,
-            media_type=content_type,
-            headers={
-                "Cache-Control": "public, max-age=86400",  # 24 hours
-                "X-Content-Type-Options": "nosniff"
-            }
-        )
+    # The reverse proxy fetches the body itself, so only the metadata is
+    # needed; otherwise one GET supplies both the body and its validators
+    if settings.use_x_accel:
+        image_info = await image_service.find_image(entity_type, entity_id, image_type)
+    else:
+        image_info = await image_service.open_image(entity_type, entity_id, image_type)
+
+    if image_info:
+        key = image_info["key"]
+        content_type = image_info["content_type"]
+        etag = image_info["etag"]
+        last_modified = image_info["last_modified"]
+
+        headers = {
+            "Cache-Control": "public, max-age=86400",  # 24 hours
+            "X-Content-Type-Options": "nosniff",
+            "Vary": "Accept-Encoding",
+        }
+        if etag:
+            headers["ETag"] = etag
+        if last_modified:
+            headers["Last-Modified"] = format_datetime(
+                last_modified.astimezone(timezone.utc), usegmt=True)
+
+        # Let clients revalidate without re-downloading unchanged images
+        if is_not_modified(request, etag, last_modified):
+            if "close" in image_info:
+                image_info["close"]()
+            return Response(status_code=304, headers=headers)
+
+        # Hand the transfer to the reverse proxy via an internal redirect
+        if settings.use_x_accel:
+            headers["X-Accel-Redirect"] = f"{settings.x_accel_prefix}{key}"
+            return Response(media_type=content_type, headers=headers)
+
+        # Otherwise stream the object in chunks rather than buffering it
+        if image_info["content_length"] is not None:
+            headers["Content-Length"] = str(image_info["content_length"])
+        # Closing again after the transfer covers clients that disconnect
+        # before the chunk iterator is exhausted
+        return StreamingResponse(
+            image_info["chunks"], media_type=content_type, headers=headers,
+            background=BackgroundTask(image_info["close"]))
 
     # If not found locally, check if we have a TVDB URL to fallback to
     fallback_url = await _get_tvdb_fallback_url(db, entity_type, entity_id, image_type)
@@ -78,7 +131,7 @@ async def get_image(
 
 
 async def _get_tvdb_fallback_url(
-    db: Session,
+    db: AsyncSession,
     entity_type: str,
     entity_id: int,
     image_type: str
@@ -86,7 +139,7 @@ async def _get_tvdb_fallback_url(
     """Get TVDB fallback URL for an image.
 
     Args:
-        db: Database session
+        db: Async database session
         entity_type: Type of entity
         entity_id: TVDB ID
         image_type: Type of image
@@ -94,23 +147,14 @@ async def _get_tvdb_fallback_url(
     Returns:
         TVDB URL or None
     """
+    column = _FALLBACK_URL_COLUMNS.get((entity_type, image_type))
+    if column is None:
+        return None
+
     try:
-        if entity_type == "series":
-            series = db.query(Series).filter(Series.tvdb_id == entity_id).first()
-            if series:
-                return getattr(series, image_type, None)
-        elif entity_type == "movie":
-            movie = db.query(Movie).filter(Movie.tvdb_id == entity_id).first()
-            if movie:
-                return getattr(movie, image_type, None)
-        elif entity_type == "episode":
-            episode = db.query(Episode).filter(Episode.tvdb_id == entity_id).first()
-            if episode:
-                return getattr(episode, "image" if image_type == "image" else None, None)
-        elif entity_type == "person":
-            person = db.query(Person).filter(Person.tvdb_id == entity_id).first()
-            if person:
-                return getattr(person, "image", None)
+        result = await db.execute(
+            select(column).where(column.class_.tvdb_id == entity_id))
+        return result.scalar_one_or_none()
     except Exception as e:
         logger.error("Failed to get fallback URL",
                      entity_type=entity_type,
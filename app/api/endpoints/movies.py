@@ -1,22 +1,21 @@
+import logging
 from typing import Any, Dict
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi.responses import ORJSONResponse
 
+from app.api.utils.rate_limit import RATE_LIMIT, limiter
 from app.auth import get_current_client
-from app.config import settings
 from app.services.tvdb_client import tvdb_client
 
 logger = structlog.get_logger()
 
 router = APIRouter()
-limiter = Limiter(key_func=get_remote_address)
 
 
 @router.get("/{movie_id}")
-@limiter.limit(f"{settings.rate_limit_requests_per_minute}/minute")
+@limiter.limit(RATE_LIMIT)
 async def get_movie(
     request: Request,
     movie_id: int,
@@ -29,41 +28,31 @@ async def get_movie(
     - **movie_id**: The TVDB movie ID
     - **extended**: If true, returns extended information including cast, crew, etc.
     """
-    try:
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
             "Movie request",
             movie_id=movie_id,
-            extended=extended,
-            client=current_client.get("client_name"))
-
-        if extended:
-            movie_data = await tvdb_client.get_movie_extended(movie_id)
-        else:
-            movie_data = await tvdb_client.get_movie(movie_id)
-
-        if not movie_data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Movie with ID {movie_id} not found"
-            )
-
-        return {
-            "data": movie_data,
-            "meta": {
-                "movie_id": movie_id,
-                "extended": extended,
-                "cached": True  # Would check if data came from cache
-            }
-        }
+            extended=extended)
+
+    if extended:
+        movie_data = await tvdb_client.get_movie_extended(movie_id)
+    else:
+        movie_data = await tvdb_client.get_movie(movie_id)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to fetch movie", movie_id=movie_id, error=str(e))
+    if not movie_data:
         raise HTTPException(
-            status_code=500,
-            detail="Failed to fetch movie data"
-        ) from e
+            status_code=404,
+            detail=f"Movie with ID {movie_id} not found"
+        )
+
+    return {
+        "data": movie_data,
+        "meta": {
+            "movie_id": movie_id,
+            "extended": extended,
+            "cached": True  # Would check if data came from cache
+        }
+    }
 
 
 @router.post("/{movie_id}/cache/invalidate")
@@ -72,7 +61,7 @@ async def invalidate_movie_cache(
     request: Request,
     movie_id: int,
     current_client: dict = Depends(get_current_client)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Invalidate cache for a specific movie
 
@@ -80,25 +69,14 @@ async def invalidate_movie_cache(
 
     - **movie_id**: The TVDB movie ID
     """
-    try:
+    if logger.isEnabledFor(logging.INFO):
         logger.info("Movie cache invalidation request",
-                    movie_id=movie_id,
-                    client=current_client.get("client_name"))
+                    movie_id=movie_id)
 
-        await tvdb_client.invalidate_cache("movie", movie_id)
+    await tvdb_client.invalidate_cache("movie", movie_id)
 
-        return {
-            "success": True,
-            "message": f"Cache invalidated for movie {movie_id}",
-            "movie_id": movie_id
-        }
-
-    except Exception as e:
-        logger.error(
-            "Failed to invalidate movie cache",
-            movie_id=movie_id,
-            error=str(e))
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to invalidate cache"
-        ) from e
+    return ORJSONResponse({
+        "success": True,
+        "message": f"Cache invalidated for movie {movie_id}",
+        "movie_id": movie_id
+    })
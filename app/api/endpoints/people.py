@@ -1,22 +1,21 @@
+import logging
 from typing import Any, Dict
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi.responses import ORJSONResponse
 
+from app.api.utils.rate_limit import RATE_LIMIT, limiter
 from app.auth import get_current_client
-from app.config import settings
 from app.services.tvdb_client import tvdb_client
 
 logger = structlog.get_logger()
 
 router = APIRouter()
-limiter = Limiter(key_func=get_remote_address)
 
 
 @router.get("/{person_id}")
-@limiter.limit(f"{settings.rate_limit_requests_per_minute}/minute")
+@limiter.limit(RATE_LIMIT)
 async def get_person(
     request: Request,
     person_id: int,
@@ -27,37 +26,24 @@ async def get_person(
 
     - **person_id**: The TVDB person ID
     """
-    try:
-        logger.info("Person request", person_id=person_id,
-                    client=current_client.get("client_name"))
-
-        person_data = await tvdb_client.get_person_extended(person_id)
-
-        if not person_data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Person with ID {person_id} not found"
-            )
-
-        return {
-            "data": person_data,
-            "meta": {
-                "person_id": person_id,
-                "cached": True  # Would check if data came from cache
-            }
-        }
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Person request", person_id=person_id)
+
+    person_data = await tvdb_client.get_person_extended(person_id)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Failed to fetch person",
-            person_id=person_id,
-            error=str(e))
+    if not person_data:
         raise HTTPException(
-            status_code=500,
-            detail="Failed to fetch person data"
-        ) from e
+            status_code=404,
+            detail=f"Person with ID {person_id} not found"
+        )
+
+    return {
+        "data": person_data,
+        "meta": {
+            "person_id": person_id,
+            "cached": True  # Would check if data came from cache
+        }
+    }
 
 
 @router.post("/{person_id}/cache/invalidate")
@@ -66,7 +52,7 @@ async def invalidate_person_cache(
     request: Request,
     person_id: int,
     current_client: dict = Depends(get_current_client)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Invalidate cache for a specific person
 
@@ -74,25 +60,14 @@ async def invalidate_person_cache(
 
     - **person_id**: The TVDB person ID
     """
-    try:
+    if logger.isEnabledFor(logging.INFO):
         logger.info("Person cache invalidation request",
-                    person_id=person_id,
-                    client=current_client.get("client_name"))
+                    person_id=person_id)
 
-        await tvdb_client.invalidate_cache("person", person_id)
+    await tvdb_client.invalidate_cache("person", person_id)
 
-        return {
-            "success": True,
-            "message": f"Cache invalidated for person {person_id}",
-            "person_id": person_id
-        }
-
-    except Exception as e:
-        logger.error(
-            "Failed to invalidate person cache",
-            person_id=person_id,
-            error=str(e))
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to invalidate cache"
-        ) from e
+    return ORJSONResponse({
+        "success": True,
+        "message": f"Cache invalidated for person {person_id}",
+        "person_id": person_id
+    })
@@ -1,336 +1,357 @@
-from typing import Any, Dict, List
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import (Integer, Select, cast, func, literal, literal_column,
+                        null, select, union_all)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.utils.rate_limit import RATE_LIMIT, limiter
+from app.api.utils.response_cache import cache_response, get_cached_response
 from app.auth import get_current_client
-from app.config import settings
-from app.redis_client import cache
+from app.database import get_async_db
+from app.models import Movie, Person, Series
 from app.services.tvdb_client import tvdb_client
 
 logger = structlog.get_logger()
 
 router = APIRouter()
-limiter = Limiter(key_func=get_remote_address)
+
+# Upstream searches currently running, keyed by their cache identifier
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+async def _single_flight(key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+    """Run ``func`` once for concurrent callers sharing ``key``.
+
+    The first caller runs the search; callers arriving while it is in flight
+    await the same result instead of issuing their own upstream request. If
+    the running caller is cancelled, only it fails: one of the waiters takes
+    over and runs the search itself.
+    """
+    while True:
+        fut = _inflight.get(key)
+        if fut is None:
+            break
+        try:
+            return await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            # Either this caller was cancelled, or the one running the
+            # search was and the shared future was cancelled with it
+            if asyncio.current_task().cancelling() or not fut.cancelled():
+                raise
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        result = await func()
+    except asyncio.CancelledError:
+        fut.cancel()
+        raise
+    except Exception as e:
+        fut.set_exception(e)
+        fut.exception()  # Mark retrieved in case nobody else was waiting
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        del _inflight[key]
 
 
 @router.get("/series")
-@limiter.limit(f"{settings.rate_limit_requests_per_minute}/minute")
+@limiter.limit(RATE_LIMIT)
 async def search_series(
     request: Request,
     q: str = Query(..., min_length=2, description="Search query (minimum 2 characters)"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
-    current_client: dict = Depends(get_current_client)
-) -> Dict[str, Any]:
+    current_client: dict = Depends(get_current_client),
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
     """
     Search for series
 
     - **q**: Search query string
     - **limit**: Maximum number of results to return (1-100)
     """
-    try:
-        logger.info("Series search request", query=q, limit=limit,
-                    client=current_client.get("client_name"))
-
-        # Check cache first
-        cached_results = cache.get("search", f"series:{q.lower()}:{limit}")
-        if cached_results:
-            logger.debug("Search cache hit", query=q)
-            return {
-                "data": cached_results,
-                "meta": {
-                    "query": q,
-                    "type": "series",
-                    "limit": limit,
-                    "cached": True
-                }
-            }
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Series search request", query=q, limit=limit)
+
+    cache_key = f"series:{q.lower()}:{limit}"
+
+    # Check cache first
+    cached_response = await get_cached_response("search", f"response:{cache_key}")
+    if cached_response:
+        logger.debug("Search cache hit", query=q)
+        return cached_response
 
+    async def run_search():
         # Perform search (this would integrate with TVDB search endpoint)
-        search_results = await tvdb_client.search_series(q)
+        results = await tvdb_client.search_series(q)
 
-        if search_results is None:
-            # Fallback to basic text matching in cached data
-            search_results = await _fallback_series_search(q, limit)
+        if results is None:
+            # Fallback to full-text search over locally synced series
+            results = await _fallback_series_search(db, q, limit)
 
         # Limit results
-        if search_results and len(search_results) > limit:
-            search_results = search_results[:limit]
+        if results and len(results) > limit:
+            results = results[:limit]
 
-        # Cache results
-        if search_results:
-            cache.set(
-                "search",
-                f"series:{q.lower()}:{limit}",
-                search_results,
-                1)  # 1 hour cache
-
-        return {
-            "data": search_results or [],
+        content = {
+            "data": results or [],
             "meta": {
                 "query": q,
                 "type": "series",
                 "limit": limit,
-                "count": len(search_results) if search_results else 0,
+                "count": len(results) if results else 0,
                 "cached": False
             }
         }
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Series search failed", query=q, error=str(e))
-        raise HTTPException(
-            status_code=500,
-            detail="Search request failed"
-        ) from e
+        # Cache results
+        if results:
+            await cache_response(
+                "search", f"response:{cache_key}", content, 1)  # 1 hour cache
+
+        return content
+
+    # Concurrent misses for the same query share one upstream search
+    return ORJSONResponse(await _single_flight(cache_key, run_search))
 
 
 @router.get("/movies")
-@limiter.limit(f"{settings.rate_limit_requests_per_minute}/minute")
+@limiter.limit(RATE_LIMIT)
 async def search_movies(
     request: Request,
     q: str = Query(..., min_length=2, description="Search query (minimum 2 characters)"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
-    current_client: dict = Depends(get_current_client)
-) -> Dict[str, Any]:
+    current_client: dict = Depends(get_current_client),
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
     """
     Search for movies
 
     - **q**: Search query string
     - **limit**: Maximum number of results to return (1-100)
     """
-    try:
-        logger.info("Movie search request", query=q, limit=limit,
-                    client=current_client.get("client_name"))
-
-        # Check cache first
-        cached_results = cache.get("search", f"movies:{q.lower()}:{limit}")
-        if cached_results:
-            logger.debug("Movie search cache hit", query=q)
-            return {
-                "data": cached_results,
-                "meta": {
-                    "query": q,
-                    "type": "movies",
-                    "limit": limit,
-                    "cached": True
-                }
-            }
-
-        # Perform search (placeholder - would integrate with TVDB search)
-        search_results = await _fallback_movie_search(q, limit)
-
-        # Cache results
-        if search_results:
-            cache.set(
-                "search",
-                f"movies:{q.lower()}:{limit}",
-                search_results,
-                1)  # 1 hour cache
-
-        return {
-            "data": search_results or [],
-            "meta": {
-                "query": q,
-                "type": "movies",
-                "limit": limit,
-                "count": len(search_results) if search_results else 0,
-                "cached": False
-            }
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Movie search request", query=q, limit=limit)
+
+    cache_key = f"movies:{q.lower()}:{limit}"
+
+    # Check cache first
+    cached_response = await get_cached_response("search", f"response:{cache_key}")
+    if cached_response:
+        logger.debug("Movie search cache hit", query=q)
+        return cached_response
+
+    # Search locally synced movies
+    search_results = await _fallback_movie_search(db, q, limit)
+
+    content = {
+        "data": search_results or [],
+        "meta": {
+            "query": q,
+            "type": "movies",
+            "limit": limit,
+            "count": len(search_results) if search_results else 0,
+            "cached": False
         }
+    }
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Movie search failed", query=q, error=str(e))
-        raise HTTPException(
-            status_code=500,
-            detail="Search request failed"
-        ) from e
+    # Cache results
+    if search_results:
+        await cache_response(
+            "search", f"response:{cache_key}", content, 1)  # 1 hour cache
+
+    return ORJSONResponse(content)
 
 
 @router.get("/people")
-@limiter.limit(f"{settings.rate_limit_requests_per_minute}/minute")
+@limiter.limit(RATE_LIMIT)
 async def search_people(
     request: Request,
     q: str = Query(..., min_length=2, description="Search query (minimum 2 characters)"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
-    current_client: dict = Depends(get_current_client)
-) -> Dict[str, Any]:
+    current_client: dict = Depends(get_current_client),
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
     """
     Search for people (actors, directors, etc.)
 
     - **q**: Search query string
     - **limit**: Maximum number of results to return (1-100)
     """
-    try:
-        logger.info("People search request", query=q, limit=limit,
-                    client=current_client.get("client_name"))
-
-        # Check cache first
-        cached_results = cache.get("search", f"people:{q.lower()}:{limit}")
-        if cached_results:
-            logger.debug("People search cache hit", query=q)
-            return {
-                "data": cached_results,
-                "meta": {
-                    "query": q,
-                    "type": "people",
-                    "limit": limit,
-                    "cached": True
-                }
-            }
-
-        # Perform search (placeholder - would integrate with TVDB search)
-        search_results = await _fallback_people_search(q, limit)
-
-        # Cache results
-        if search_results:
-            cache.set(
-                "search",
-                f"people:{q.lower()}:{limit}",
-                search_results,
-                1)  # 1 hour cache
-
-        return {
-            "data": search_results or [],
-            "meta": {
-                "query": q,
-                "type": "people",
-                "limit": limit,
-                "count": len(search_results) if search_results else 0,
-                "cached": False
-            }
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("People search request", query=q, limit=limit)
+
+    cache_key = f"people:{q.lower()}:{limit}"
+
+    # Check cache first
+    cached_response = await get_cached_response("search", f"response:{cache_key}")
+    if cached_response:
+        logger.debug("People search cache hit", query=q)
+        return cached_response
+
+    # Search locally synced people
+    search_results = await _fallback_people_search(db, q, limit)
+
+    content = {
+        "data": search_results or [],
+        "meta": {
+            "query": q,
+            "type": "people",
+            "limit": limit,
+            "count": len(search_results) if search_results else 0,
+            "cached": False
         }
+    }
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("People search failed", query=q, error=str(e))
-        raise HTTPException(
-            status_code=500,
-            detail="Search request failed"
-        ) from e
+    # Cache results
+    if search_results:
+        await cache_response(
+            "search", f"response:{cache_key}", content, 1)  # 1 hour cache
+
+    return ORJSONResponse(content)
 
 
 @router.get("/all")
-@limiter.limit(f"{settings.rate_limit_requests_per_minute}/minute")
+@limiter.limit(RATE_LIMIT)
 async def search_all(
     request: Request,
     q: str = Query(..., min_length=2, description="Search query (minimum 2 characters)"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of results per type"),
-    current_client: dict = Depends(get_current_client)
-) -> Dict[str, Any]:
+    current_client: dict = Depends(get_current_client),
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
     """
     Search across all content types (series, movies, people)
 
     - **q**: Search query string
     - **limit**: Maximum number of results per content type (1-100)
     """
-    try:
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
             "Universal search request",
             query=q,
-            limit=limit,
-            client=current_client.get("client_name"))
-
-        # Check cache first
-        cached_results = cache.get("search", f"all:{q.lower()}:{limit}")
-        if cached_results:
-            logger.debug("Universal search cache hit", query=q)
-            return {
-                "data": cached_results,
-                "meta": {
-                    "query": q,
-                    "type": "all",
-                    "limit": limit,
-                    "cached": True
-                }
-            }
-
-        # Perform searches across all types
-        series_results = await _fallback_series_search(q, limit)
-        movie_results = await _fallback_movie_search(q, limit)
-        people_results = await _fallback_people_search(q, limit)
-
-        combined_results = {
-            "series": series_results or [],
-            "movies": movie_results or [],
-            "people": people_results or []
-        }
-
-        # Cache results
-        cache.set(
-            "search",
-            f"all:{q.lower()}:{limit}",
-            combined_results,
-            1)  # 1 hour cache
-
-        total_count = len(combined_results["series"]) + len(
-            combined_results["movies"]) + len(combined_results["people"])
-
-        return {
-            "data": combined_results,
-            "meta": {
-                "query": q,
-                "type": "all",
-                "limit": limit,
-                "total_count": total_count,
-                "counts": {
-                    "series": len(combined_results["series"]),
-                    "movies": len(combined_results["movies"]),
-                    "people": len(combined_results["people"])
-                },
-                "cached": False
-            }
+            limit=limit)
+
+    cache_key = f"all:{q.lower()}:{limit}"
+
+    # Check cache first
+    cached_response = await get_cached_response("search", f"response:{cache_key}")
+    if cached_response:
+        logger.debug("Universal search cache hit", query=q)
+        return cached_response
+
+    # Perform searches across all types in one round-trip
+    combined_results = await _fallback_search_all(db, q, limit)
+
+    total_count = len(combined_results["series"]) + len(
+        combined_results["movies"]) + len(combined_results["people"])
+
+    content = {
+        "data": combined_results,
+        "meta": {
+            "query": q,
+            "type": "all",
+            "limit": limit,
+            "total_count": total_count,
+            "counts": {
+                "series": len(combined_results["series"]),
+                "movies": len(combined_results["movies"]),
+                "people": len(combined_results["people"])
+            },
+            "cached": False
         }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Universal search failed", query=q, error=str(e))
-        raise HTTPException(
-            status_code=500,
-            detail="Search request failed"
-        ) from e
+    }
+
+    # Cache results
+    if total_count:
+        await cache_response(
+            "search", f"response:{cache_key}", content, 1)  # 1 hour cache
+
+    return ORJSONResponse(content)
+
+
+# Fallback search functions (full-text match on locally synced names).
+# Database errors propagate to the global handler rather than being reported,
+# and cached, as an empty result.
+# A literal config keeps the expression identical to the GIN index definition
+_TS_CONFIG = literal_column("'simple'::regconfig")
+
+
+def _name_search_stmt(model, result_type: str, query: str, limit: int) -> Select:
+    """Ranked full-text search over ``model.name``, served by its GIN index"""
+    name_tsv = func.to_tsvector(_TS_CONFIG, model.name)
+    tsquery = func.plainto_tsquery(_TS_CONFIG, query)
+    rank = func.ts_rank(name_tsv, tsquery)
+    year = model.year if hasattr(model, "year") else cast(null(), Integer)
+
+    return (
+        select(
+            literal(result_type).label("type"),
+            model.tvdb_id.label("id"),
+            model.name,
+            model.slug,
+            model.image,
+            year.label("year"),
+            rank.label("rank"),
+        )
+        .where(name_tsv.op("@@")(tsquery))
+        .order_by(rank.desc())
+        .limit(limit)
+    )
+
+
+def _search_result(row) -> Dict[str, Any]:
+    """Shape a search row as returned to clients"""
+    return {
+        "id": row.id,
+        "name": row.name,
+        "slug": row.slug,
+        "image": row.image,
+        "year": row.year,
+    }
 
 
-# Fallback search functions (using cached index data)
 async def _fallback_series_search(
-        query: str, limit: int) -> List[Dict[str, Any]]:
-    """Fallback series search using cached index"""
-    try:
-        # This would search through cached series data
-        # For now, return empty list
-        logger.debug("Performing fallback series search", query=query)
-        return []
-    except Exception as e:
-        logger.error("Fallback series search failed", error=str(e))
-        return []
+        db: AsyncSession, query: str, limit: int) -> List[Dict[str, Any]]:
+    """Fallback series search using locally synced series"""
+    logger.debug("Performing fallback series search", query=query)
+    rows = await db.execute(_name_search_stmt(Series, "series", query, limit))
+    return [_search_result(row) for row in rows]
 
 
 async def _fallback_movie_search(
-        query: str, limit: int) -> List[Dict[str, Any]]:
-    """Fallback movie search using cached index"""
-    try:
-        # This would search through cached movie data
-        logger.debug("Performing fallback movie search", query=query)
-        return []
-    except Exception as e:
-        logger.error("Fallback movie search failed", error=str(e))
-        return []
+        db: AsyncSession, query: str, limit: int) -> List[Dict[str, Any]]:
+    """Fallback movie search using locally synced movies"""
+    logger.debug("Performing fallback movie search", query=query)
+    rows = await db.execute(_name_search_stmt(Movie, "movies", query, limit))
+    return [_search_result(row) for row in rows]
 
 
 async def _fallback_people_search(
-        query: str, limit: int) -> List[Dict[str, Any]]:
-    """Fallback people search using cached index"""
-    try:
-        # This would search through cached people data
-        logger.debug("Performing fallback people search", query=query)
-        return []
-    except Exception as e:
-        logger.error("Fallback people search failed", error=str(e))
-        return []
+        db: AsyncSession, query: str, limit: int) -> List[Dict[str, Any]]:
+    """Fallback people search using locally synced people"""
+    logger.debug("Performing fallback people search", query=query)
+    rows = await db.execute(_name_search_stmt(Person, "people", query, limit))
+    return [_search_result(row) for row in rows]
+
+
+async def _fallback_search_all(
+        db: AsyncSession, query: str, limit: int) -> Dict[str, List[Dict[str, Any]]]:
+    """Fallback search across all types as a single UNION ALL query"""
+    results: Dict[str, List[Dict[str, Any]]] = {"series": [], "movies": [], "people": []}
+    logger.debug("Performing fallback universal search", query=query)
+    rows = await db.execute(union_all(
+        _name_search_stmt(Series, "series", query, limit),
+        _name_search_stmt(Movie, "movies", query, limit),
+        _name_search_stmt(Person, "people", query, limit),
+    ))
+    for row in rows:
+        results[row.type].append(_search_result(row))
+    return results
@@ -1,91 +1,88 @@
-from typing import Any, Dict, Optional
+import logging
+from typing import Optional
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.utils.image_urls import enrich_with_local_images, get_base_url
+from app.api.utils.rate_limit import RATE_LIMIT, limiter
+from app.api.utils.response_cache import cache_and_respond, get_cached_response
 from app.auth import get_current_client
 from app.config import settings
-from app.database import get_db
+from app.database import get_async_db
+from app.redis_client import async_cache
 from app.services.tvdb_client import tvdb_client
 
 logger = structlog.get_logger()
 
 router = APIRouter()
-limiter = Limiter(key_func=get_remote_address)
 
 
 @router.get("/{series_id}")
-@limiter.limit(f"{settings.rate_limit_requests_per_minute}/minute")
+@limiter.limit(RATE_LIMIT)
 async def get_series(
     request: Request,
     series_id: int,
     extended: bool = Query(False, description="Return extended series information"),
     current_client: dict = Depends(get_current_client),
-    db: Session = Depends(get_db)
-) -> Dict[str, Any]:
+    db: AsyncSession = Depends(get_async_db)
+) -> Response:
     """
     Get series information by TVDB ID
 
     - **series_id**: The TVDB series ID
     - **extended**: If true, returns extended information including cast, crew, etc.
     """
-    try:
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
             "Series request",
             series_id=series_id,
-            extended=extended,
-            client=current_client.get("client_name"))
-
-        if extended:
-            series_data = await tvdb_client.get_series_extended(series_id)
-        else:
-            series_data = await tvdb_client.get_series(series_id)
-
-        if not series_data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Series with ID {series_id} not found"
-            )
-
-        # Enrich with local image URLs
-        base_url = get_base_url(request)
-        series_data = enrich_with_local_images(series_data, 'series', db, base_url)
-
-        return {
-            "data": series_data,
-            "meta": {
-                "series_id": series_id,
-                "extended": extended,
-                "cached": True  # Would check if data came from cache
-            }
-        }
+            extended=extended)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Failed to fetch series",
-            series_id=series_id,
-            error=str(e))
+    # Enriched image URLs depend on the base URL, so it is part of the key
+    base_url = get_base_url(request)
+    cache_key = f"series:{series_id}:detail:{int(extended)}:{base_url}"
+    cached_response = await get_cached_response("response", cache_key, request)
+    if cached_response:
+        return cached_response
+
+    if extended:
+        series_data = await tvdb_client.get_series_extended(series_id)
+    else:
+        series_data = await tvdb_client.get_series(series_id)
+
+    if not series_data:
         raise HTTPException(
-            status_code=500,
-            detail="Failed to fetch series data"
-        ) from e
+            status_code=404,
+            detail=f"Series with ID {series_id} not found"
+        )
+
+    # Enrich with local image URLs
+    series_data = await enrich_with_local_images(series_data, 'series', db, base_url)
+
+    content = {
+        "data": series_data,
+        "meta": {
+            "series_id": series_id,
+            "extended": extended,
+            "cached": False
+        }
+    }
+    return await cache_and_respond(
+        request, "response", cache_key, content, settings.cache_ttl_dynamic_hours)
 
 
 @router.get("/{series_id}/episodes")
-@limiter.limit(f"{settings.rate_limit_requests_per_minute}/minute")
+@limiter.limit(RATE_LIMIT)
 async def get_series_episodes(
     request: Request,
     series_id: int,
     page: int = Query(0, ge=0, description="Page number for pagination"),
     season: Optional[int] = Query(None, description="Filter by season number"),
     current_client: dict = Depends(get_current_client)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get episodes for a series
 
@@ -93,160 +90,137 @@ async def get_series_episodes(
     - **page**: Page number for pagination (starts at 0)
     - **season**: Optional season number filter
     """
-    try:
+    if logger.isEnabledFor(logging.INFO):
         logger.info("Series episodes request",
                     series_id=series_id,
                     page=page,
-                    season=season,
-                    client=current_client.get("client_name"))
-
-        episodes_data = await tvdb_client.get_series_episodes(series_id, page)
-
-        if not episodes_data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No episodes found for series {series_id}"
-            )
-
-        # Filter by season if requested
-        if season is not None and episodes_data.get('data'):
-            filtered_episodes = [
-                ep for ep in episodes_data['data']
-                if ep.get('seasonNumber') == season
-            ]
-            episodes_data['data'] = filtered_episodes
-
-        return {
-            "data": episodes_data.get(
-                'data',
-                []),
-            "meta": {
-                "series_id": series_id,
-                "page": page,
-                "season_filter": season,
-                "total_pages": episodes_data.get(
-                    'links',
-                    {}).get('totalPages'),
-                "has_next": bool(
-                    episodes_data.get(
-                        'links',
-                        {}).get('next')),
-                "has_prev": bool(
-                    episodes_data.get(
-                        'links',
-                        {}).get('prev'))}}
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Failed to fetch series episodes",
-            series_id=series_id,
-            error=str(e))
+                    season=season)
+
+    cache_key = f"series:{series_id}:episodes:{page}:{season}"
+    cached_response = await get_cached_response("response", cache_key, request)
+    if cached_response:
+        return cached_response
+
+    episodes_data = await tvdb_client.get_series_episodes(series_id, page, season=season)
+
+    if not episodes_data:
         raise HTTPException(
-            status_code=500,
-            detail="Failed to fetch series episodes"
-        ) from e
+            status_code=404,
+            detail=f"No episodes found for series {series_id}"
+        )
+
+    # TVDB links carry item counts rather than a page count
+    links = episodes_data.get('links') or {}
+    total_items = links.get('total_items')
+    page_size = links.get('page_size')
+    total_pages = -(-total_items // page_size) if total_items and page_size else None
+    content = {
+        "data": episodes_data.get('data', []),
+        "meta": {
+            "series_id": series_id,
+            "page": page,
+            "season_filter": season,
+            "total_pages": total_pages,
+            "has_next": bool(links.get('next')),
+            "has_prev": bool(links.get('prev')),
+            "cached": False
+        }
+    }
+    return await cache_and_respond(
+        request, "response", cache_key, content, settings.cache_ttl_dynamic_hours)
 
 
 @router.get("/{series_id}/seasons/{season_id}")
-@limiter.limit(f"{settings.rate_limit_requests_per_minute}/minute")
+@limiter.limit(RATE_LIMIT)
 async def get_season(
     request: Request,
     series_id: int,
     season_id: int,
     current_client: dict = Depends(get_current_client)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get season information
 
     - **series_id**: The TVDB series ID
     - **season_id**: The TVDB season ID
     """
-    try:
+    if logger.isEnabledFor(logging.INFO):
         logger.info("Season request",
                     series_id=series_id,
-                    season_id=season_id,
-                    client=current_client.get("client_name"))
+                    season_id=season_id)
 
-        season_data = await tvdb_client.get_season_extended(season_id)
+    cache_key = f"series:{series_id}:season:{season_id}"
+    cached_response = await get_cached_response("response", cache_key, request)
+    if cached_response:
+        return cached_response
 
-        if not season_data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Season with ID {season_id} not found"
-            )
+    season_data = await tvdb_client.get_season_extended(season_id)
 
-        return {
-            "data": season_data,
-            "meta": {
-                "series_id": series_id,
-                "season_id": season_id
-            }
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Failed to fetch season",
-            season_id=season_id,
-            error=str(e))
+    if not season_data:
         raise HTTPException(
-            status_code=500,
-            detail="Failed to fetch season data"
-        ) from e
+            status_code=404,
+            detail=f"Season with ID {season_id} not found"
+        )
+
+    content = {
+        "data": season_data,
+        "meta": {
+            "series_id": series_id,
+            "season_id": season_id,
+            "cached": False
+        }
+    }
+    return await cache_and_respond(
+        request, "response", cache_key, content, settings.cache_ttl_dynamic_hours)
 
 
 @router.get("/")
-@limiter.limit(f"{settings.rate_limit_requests_per_minute}/minute")
+@limiter.limit(RATE_LIMIT)
 async def get_all_series(
     request: Request,
     page: int = Query(0, ge=0, description="Page number for pagination"),
     current_client: dict = Depends(get_current_client)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get all series with pagination
 
     - **page**: Page number for pagination (starts at 0)
     """
-    try:
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
             "All series request",
-            page=page,
-            client=current_client.get("client_name"))
-
-        series_data = await tvdb_client.get_all_series(page)
-
-        if not series_data:
-            return {
-                "data": [],
-                "meta": {
-                    "page": page,
-                    "total_pages": 0,
-                    "has_next": False,
-                    "has_prev": False
-                }
-            }
+            page=page)
+
+    cache_key = f"series_list:{page}"
+    cached_response = await get_cached_response("response", cache_key, request)
+    if cached_response:
+        return cached_response
+
+    series_data = await tvdb_client.get_all_series(page)
 
-        return {
-            "data": series_data.get('data', []),
+    if not series_data:
+        return ORJSONResponse({
+            "data": [],
             "meta": {
                 "page": page,
-                "total_pages": series_data.get('links', {}).get('totalPages'),
-                "has_next": bool(series_data.get('links', {}).get('next')),
-                "has_prev": bool(series_data.get('links', {}).get('prev'))
+                "total_pages": 0,
+                "has_next": False,
+                "has_prev": False
             }
+        })
+
+    content = {
+        "data": series_data.get('data', []),
+        "meta": {
+            "page": page,
+            "total_pages": series_data.get('links', {}).get('totalPages'),
+            "has_next": bool(series_data.get('links', {}).get('next')),
+            "has_prev": bool(series_data.get('links', {}).get('prev')),
+            "cached": False
         }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to fetch all series", page=page, error=str(e))
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to fetch series list"
-        ) from e
+    }
+    return await cache_and_respond(
+        request, "response", cache_key, content, settings.cache_ttl_dynamic_hours)
 
 
 @router.post("/{series_id}/cache/invalidate")
@@ -255,7 +229,7 @@ async def invalidate_series_cache(
     request: Request,
     series_id: int,
     current_client: dict = Depends(get_current_client)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Invalidate cache for a specific series
 
@@ -263,25 +237,15 @@ async def invalidate_series_cache(
 
     - **series_id**: The TVDB series ID
     """
-    try:
+    if logger.isEnabledFor(logging.INFO):
         logger.info("Cache invalidation request",
-                    series_id=series_id,
-                    client=current_client.get("client_name"))
+                    series_id=series_id)
 
-        await tvdb_client.invalidate_cache("series", series_id)
+    await tvdb_client.invalidate_cache("series", series_id)
+    await async_cache.flush_pattern(f"response:series:{series_id}:*")
 
-        return {
-            "success": True,
-            "message": f"Cache invalidated for series {series_id}",
-            "series_id": series_id
-        }
-
-    except Exception as e:
-        logger.error(
-            "Failed to invalidate cache",
-            series_id=series_id,
-            error=str(e))
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to invalidate cache"
-        ) from e
+    return ORJSONResponse({
+        "success": True,
+        "message": f"Cache invalidated for series {series_id}",
+        "series_id": series_id
+    })
@@ -1,12 +1,13 @@
 """TVDB v4 API compliant authentication endpoints"""
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
 
 import structlog
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
-from app.auth import create_access_token
+from app.auth import create_access_token, record_api_key_usage
 from app.database import SessionLocal
 from app.models import ApiKey
 
@@ -17,6 +18,8 @@ router = APIRouter()
 
 class LoginRequest(BaseModel):
     """TVDB v4 compliant login request"""
+    model_config = ConfigDict(frozen=True)
+
     apikey: str
     pin: Optional[str] = None
 
@@ -28,7 +31,7 @@ class LoginResponse(BaseModel):
 
 
 @router.post("/login", response_model=LoginResponse)
-async def tvdb_login(credentials: LoginRequest):
+async def tvdb_login(credentials: LoginRequest, background_tasks: BackgroundTasks):
     """
     TVDB v4 API compliant login endpoint
 
@@ -74,10 +77,9 @@ async def tvdb_login(credentials: LoginRequest):
                 detail="Invalid credentials"
             )
 
-        # Update usage statistics
-        api_key.last_used = datetime.utcnow()
-        api_key.total_requests += 1
-        db.commit()
+        # Count the login in Redis once the response is sent; the counters
+        # are flushed to the database in bulk by flush_api_key_usage
+        background_tasks.add_task(record_api_key_usage, api_key.id)
 
         # Create JWT token with 1 month validity (TVDB standard)
         access_token_expires = timedelta(days=30)  # 1 month
@@ -97,20 +99,14 @@ async def tvdb_login(credentials: LoginRequest):
             requires_pin=api_key.requires_pin
         )
 
-        # Return TVDB v4 compliant response
-        return LoginResponse(
-            data={"token": access_token},
-            status="success"
-        )
+        # Return TVDB v4 compliant response; returning the response directly
+        # skips re-validating this fixed shape against LoginResponse, which
+        # still documents it
+        return ORJSONResponse({
+            "data": {"token": access_token},
+            "status": "success"
+        })
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("TVDB login failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Authentication service error"
-        ) from e
     finally:
         db.close()
 
@@ -0,0 +1,47 @@
+"""Evaluation of conditional GET headers shared by cached endpoints."""
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request
+
+
+def is_not_modified(request: Request, etag: Optional[str],
+                    last_modified: Optional[datetime] = None) -> bool:
+    """Check the request's conditional headers against the current representation.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+
+    Args:
+        request: Incoming request
+        etag: Current ETag, strong or weak
+        last_modified: Current modification time, if known
+
+    Returns:
+        True if a 304 Not Modified response should be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if not etag:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison: ignore W/ prefixes on either side
+        current = etag.removeprefix("W/")
+        return any(
+            candidate.strip().removeprefix("W/") == current
+            for candidate in if_none_match.split(",")
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates have one-second resolution
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
@@ -1,13 +1,40 @@
 """Utilities for handling image URLs in API responses."""
-from typing import Any, Dict
+import asyncio
+from operator import attrgetter
+from typing import Any, Dict, List, Optional
 
 from fastapi import Request
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.models import Episode, Movie, Person, Season, Series
 from app.services.image_service import image_service
-from app.services.storage import storage
+
+
+# Configured CDN base URL, normalised once at import
+_CDN_BASE_URL = settings.cdn_base_url.rstrip('/') if settings.cdn_base_url else None
+
+# Model holding the local image URLs for each entity type
+ENTITY_MODELS = {
+    'series': Series,
+    'movie': Movie,
+    'episode': Episode,
+    'person': Person,
+    'season': Season,
+}
+
+# TVDB image fields paired with getters for the matching local URL column
+_IMAGE_FIELDS = tuple(
+    (tvdb_field, attrgetter(local_field))
+    for tvdb_field, local_field in {
+        'image': 'local_image_url',
+        'poster': 'local_poster_url',
+        'banner': 'local_banner_url',
+        'fanart': 'local_fanart_url',
+        'thumbnail': 'local_thumbnail_url',
+    }.items()
+)
 
 
 def get_base_url(request: Request) -> str:
@@ -20,10 +47,19 @@ def get_base_url(request: Request) -> str:
         Base URL string (e.g., https://api.example.com)
     """
     # Use CDN URL if configured
-    if settings.cdn_base_url:
-        return settings.cdn_base_url.rstrip('/')
+    if _CDN_BASE_URL:
+        return _CDN_BASE_URL
+
+    # Otherwise construct from request, once per request
+    base_url = getattr(request.state, 'base_url', None)
+    if base_url is None:
+        base_url = _request_base_url(request)
+        request.state.base_url = base_url
+    return base_url
+
 
-    # Otherwise construct from request
+def _request_base_url(request: Request) -> str:
+    """Build the base URL from the request's scheme, host and port"""
     scheme = request.url.scheme
     host = request.headers.get('x-forwarded-host', request.url.hostname)
     port = request.url.port
@@ -35,8 +71,11 @@ def get_base_url(request: Request) -> str:
     return f"{scheme}://{host}"
 
 
-def enrich_with_local_images(data: Dict[str, Any], entity_type: str,
-                             db: Session, base_url: str) -> Dict[str, Any]:
+async def enrich_with_local_images(data: Dict[str, Any], entity_type: str,
+                                   db: AsyncSession, base_url: str,
+                                   entity: Optional[Any] = None,
+                                   manifest: Optional[Dict[str, str]] = None
+                                   ) -> Dict[str, Any]:
     """Enrich entity data with local image URLs.
 
     This function checks if we have local images stored and replaces TVDB URLs
@@ -47,6 +86,8 @@ def enrich_with_local_images(data: Dict[str, Any], entity_type: str,
         entity_type: Type of entity (series, movie, episode, person)
         db: Database session
         base_url: Base URL for constructing image URLs
+        entity: Database row for the entity, if already loaded
+        manifest: Stored-image manifest for the entity, if already fetched
 
     Returns:
         Modified data dictionary with local image URLs
@@ -59,67 +100,57 @@ def enrich_with_local_images(data: Dict[str, Any], entity_type: str,
         return data
 
     # Get entity from database to check for local images
-    entity = None
-    if entity_type == 'series':
-        entity = db.query(Series).filter(Series.tvdb_id == entity_id).first()
-    elif entity_type == 'movie':
-        entity = db.query(Movie).filter(Movie.tvdb_id == entity_id).first()
-    elif entity_type == 'episode':
-        entity = db.query(Episode).filter(Episode.tvdb_id == entity_id).first()
-    elif entity_type == 'person':
-        entity = db.query(Person).filter(Person.tvdb_id == entity_id).first()
-    elif entity_type == 'season':
-        entity = db.query(Season).filter(Season.tvdb_id == entity_id).first()
+    if entity is None:
+        model = ENTITY_MODELS.get(entity_type)
+        if model is not None:
+            result = await db.execute(select(model).where(model.tvdb_id == entity_id))
+            entity = result.scalars().first()
 
     if not entity:
         return data
 
-    # Map of TVDB fields to local fields
-    image_field_map = {
-        'image': 'local_image_url',
-        'poster': 'local_poster_url',
-        'banner': 'local_banner_url',
-        'fanart': 'local_fanart_url',
-        'thumbnail': 'local_thumbnail_url'
-    }
-
-    # Replace image URLs with local ones if available
-    for tvdb_field, local_field in image_field_map.items():
-        if tvdb_field in data and hasattr(entity, local_field):
-            local_url = getattr(entity, local_field, None)
-
-            # Check if we have a local image stored
-            if local_url or _check_local_image_exists(entity_type, entity_id, tvdb_field):
-                # Generate the local URL
-                data[tvdb_field] = image_service.get_local_image_url(
-                    entity_type, entity_id, tvdb_field, base_url
-                )
+    # Image types with a local URL column set are known to be stored; the
+    # rest are looked up in the stored-image manifest
+    local_fields = []
+    unresolved = []
+    for tvdb_field, get_local_url in _IMAGE_FIELDS:
+        if tvdb_field not in data:
+            continue
+        try:
+            local_url = get_local_url(entity)
+        except AttributeError:
+            # Entity type has no local column for this image
+            continue
+        (local_fields if local_url else unresolved).append(tvdb_field)
+
+    if unresolved:
+        if manifest is None:
+            manifest = (await image_service.get_image_manifests(
+                entity_type, [entity_id]))[entity_id]
+        # Image types missing from the manifest need blocking storage probes
+        if any(field not in manifest for field in unresolved):
+            await asyncio.to_thread(
+                _probe_stored_images, entity_type, entity_id, unresolved, manifest)
+        local_fields.extend(field for field in unresolved if manifest.get(field))
+
+    for tvdb_field in local_fields:
+        data[tvdb_field] = image_service.get_local_image_url(
+            entity_type, entity_id, tvdb_field, base_url
+        )
 
     return data
 
 
-def _check_local_image_exists(entity_type: str, entity_id: int, image_type: str) -> bool:
-    """Check if a local image exists in storage.
+def _probe_stored_images(entity_type: str, entity_id: int, image_types: List[str],
+                         manifest: Dict[str, str]):
+    """Probe storage for image types missing from a manifest, updating it in place"""
+    for image_type in image_types:
+        if image_type not in manifest:
+            image_service.find_image_extension(entity_type, entity_id, image_type, manifest)
 
-    Args:
-        entity_type: Type of entity
-        entity_id: Entity ID
-        image_type: Type of image
 
-    Returns:
-        True if image exists locally
-    """
-
-    # Check for common image extensions
-    for ext in ['jpg', 'jpeg', 'png', 'gif', 'webp']:
-        key = f"{entity_type}/{entity_id}/{image_type}.{ext}"
-        if storage.image_exists(key):
-            return True
-    return False
-
-
-def enrich_list_with_local_images(data_list: list, entity_type: str,
-                                  db: Session, base_url: str) -> list:
+async def enrich_list_with_local_images(data_list: list, entity_type: str,
+                                        db: AsyncSession, base_url: str) -> list:
     """Enrich a list of entities with local image URLs.
 
     Args:
@@ -134,5 +165,26 @@ def enrich_list_with_local_images(data_list: list, entity_type: str,
     if not data_list or not isinstance(data_list, list):
         return data_list
 
-    return [enrich_with_local_images(item, entity_type, db, base_url)
-            for item in data_list]
+    model = ENTITY_MODELS.get(entity_type)
+    if model is None:
+        return data_list
+
+    # Load every listed entity in one query instead of one per item
+    ids = [item.get('id') for item in data_list
+           if isinstance(item, dict) and item.get('id')]
+    if not ids:
+        return data_list
+    result = await db.execute(select(model).where(model.tvdb_id.in_(ids)))
+    by_id = {row.tvdb_id: row for row in result.scalars()}
+
+    # Fetch every listed entity's stored-image manifest in one round trip
+    manifests = await image_service.get_image_manifests(entity_type, list(by_id))
+
+    enriched = []
+    for item in data_list:
+        entity = by_id.get(item.get('id')) if isinstance(item, dict) else None
+        if entity is not None:
+            item = await enrich_with_local_images(
+                item, entity_type, db, base_url, entity, manifests[entity.tvdb_id])
+        enriched.append(item)
+    return enriched
@@ -0,0 +1,33 @@
+"""Shared rate limit settings for the API endpoints."""
+from fastapi import Request
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from app.config import settings
+
+# Default per-client limit for content endpoints, formatted once at import
+RATE_LIMIT = f"{settings.rate_limit_requests_per_minute}/minute"
+
+
+def rate_limit_key(request: Request) -> str:
+    """Rate limit bucket for a request: the caller's API key, else its IP.
+
+    slowapi evaluates this after dependencies have run, so authenticated
+    requests carry the identity ``get_current_client`` resolved. Every JWT
+    minted from a key shares that key's bucket, and clients behind a shared
+    NAT do not exhaust each other's limits.
+    """
+    identity = getattr(request.state, "client_identity", None)
+    if identity:
+        return f"client:{identity}"
+    return get_remote_address(request)
+
+
+# Counters live in Redis so limits hold across all workers; the moving window
+# avoids the burst allowed at fixed-window boundaries
+limiter = Limiter(
+    key_func=rate_limit_key,
+    storage_uri=settings.redis_url,
+    strategy="moving-window",
+    in_memory_fallback_enabled=True,
+)
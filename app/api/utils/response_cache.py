@@ -0,0 +1,90 @@
+"""Caching of fully rendered JSON responses in Redis."""
+import hashlib
+from typing import Any, Dict, Optional, Union
+
+import orjson
+from fastapi import Request, Response
+
+from app.api.utils.conditional import is_not_modified
+from app.redis_client import async_cache
+
+_CACHE_HIT_HEADERS = {"X-Cache": "HIT"}
+
+
+def _etag(body: bytes) -> str:
+    """Weak ETag for a cached body.
+
+    Weak because a miss is answered with the same payload except for
+    ``meta.cached``, which is not a meaningful change to the client.
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _respond(request: Optional[Request], body: bytes, etag: str,
+             headers: Dict[str, str]) -> Response:
+    """JSON response for a body, or 304 if the client already has it"""
+    headers = {**headers, "ETag": etag}
+    if request is not None and is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def get_cached_response(prefix: str, identifier: Union[str, int],
+                              request: Optional[Request] = None) -> Optional[Response]:
+    """Return a cached response as stored, without re-serializing it.
+
+    Args:
+        prefix: Cache key prefix
+        identifier: Cache key identifier
+        request: Incoming request; when given, the response carries an ETag
+            and is a 304 if the client's If-None-Match matches it
+
+    Returns:
+        JSON response carrying the cached bytes, or None on a miss
+    """
+    cached = await async_cache.get_raw(prefix, identifier)
+    if not cached:
+        return None
+    if request is None:
+        return Response(content=cached, media_type="application/json",
+                        headers=_CACHE_HIT_HEADERS)
+    return _respond(request, cached, _etag(cached), _CACHE_HIT_HEADERS)
+
+
+async def cache_response(prefix: str, identifier: Union[str, int],
+                         content: Dict[str, Any], ttl_hours: int) -> bool:
+    """Store the rendered response that a later cache hit will return.
+
+    The stored copy has ``meta.cached`` set, so hits report themselves.
+
+    Args:
+        prefix: Cache key prefix
+        identifier: Cache key identifier
+        content: Response envelope with ``data`` and ``meta``
+        ttl_hours: Time to live in hours
+
+    Returns:
+        True if the response was cached
+    """
+    hit = {**content, "meta": {**content["meta"], "cached": True}}
+    return await async_cache.set_raw(prefix, identifier, orjson.dumps(hit), ttl_hours)
+
+
+async def cache_and_respond(request: Request, prefix: str, identifier: Union[str, int],
+                            content: Dict[str, Any], ttl_hours: int) -> Response:
+    """Cache a freshly built response and return it with the cached copy's ETag.
+
+    Args:
+        request: Incoming request, checked for If-None-Match
+        prefix: Cache key prefix
+        identifier: Cache key identifier
+        content: Response envelope with ``data`` and ``meta``
+        ttl_hours: Time to live in hours
+
+    Returns:
+        JSON response for ``content``, or 304 if the client already has it
+    """
+    hit = {**content, "meta": {**content["meta"], "cached": True}}
+    hit_body = orjson.dumps(hit)
+    await async_cache.set_raw(prefix, identifier, hit_body, ttl_hours)
+    return _respond(request, orjson.dumps(content), _etag(hit_body), {})
@@ -1,46 +1,77 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
 import structlog
-from fastapi import Depends, HTTPException, status
+from cachetools import TLRUCache, TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from jose import JWTError, jwk, jwt
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.database import SessionLocal
 from app.models import ApiKey
+from app.redis_client import async_redis_client, redis_client
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = structlog.get_logger()
 
 # JWT token handling
 security = HTTPBearer()
 
-# Default API keys for demo (in production, store in database)
-VALID_API_KEYS = {
-    "demo-key-1": {
-        "name": "Demo Client 1",
-        "rate_limit": 100,
-        "active": True
-    },
-    "demo-key-2": {
-        "name": "Demo Client 2",
-        "rate_limit": 200,
-        "active": True
-    }
+# Tokens are HMAC-signed with the app secret; build the key object once rather
+# than having python-jose re-construct it on every encode/decode
+JWT_ALGORITHM = "HS256"
+_JWT_SIGNING_KEY = jwk.construct(settings.secret_key, JWT_ALGORITHM)
+
+# Resolved clients keyed by a digest of the bearer token, so repeat requests
+# with the same token skip JWT verification and the API key lookup
+CLIENT_CACHE_TTL_SECONDS = 60
+_client_cache: TTLCache = TTLCache(maxsize=10_000, ttl=CLIENT_CACHE_TTL_SECONDS)
+_client_cache_lock = threading.Lock()
+
+# Bumped in Redis whenever an API key is changed, deleted or rotated. Each
+# worker compares it at most once per interval and drops its whole client
+# cache when it moves, so revocations reach other processes within about a
+# second rather than after CLIENT_CACHE_TTL_SECONDS.
+REVOCATION_GENERATION_KEY = "tvdb:auth:revocation_generation"
+REVOCATION_CHECK_INTERVAL_SECONDS = 1.0
+_revocation_generation: Optional[bytes] = None
+_revocation_checked_at = 0.0
+
+# Decoded JWT payloads keyed by token digest, each kept until its own exp
+_jwt_cache: TLRUCache = TLRUCache(
+    maxsize=4096,
+    ttu=lambda _key, payload, now: payload.get("exp", now),
+    timer=time.time,
+)
+_jwt_cache_lock = threading.Lock()
+
+# Validated database API keys are cached in Redis under the key's SHA-256,
+# so the raw key never lands in Redis
+API_KEY_CACHE_TTL_SECONDS = 60
+
+# Per-key usage not yet written to the database: key id -> request count and
+# key id -> last use (unix time); flushed by the flush_api_key_usage task
+API_KEY_USAGE_REQUESTS = "tvdb:auth:usage:requests"
+API_KEY_USAGE_LAST_USED = "tvdb:auth:usage:last_used"
+
+# Built-in demo keys, honoured only when settings.debug is set; elsewhere the
+# same keys come from the database via scripts/init_demo_keys.py
+_DEMO_KEYS = {
+    "demo-key-1": {"name": "Demo Client 1", "rate_limit": 100},
+    "demo-key-2": {"name": "Demo Client 2", "rate_limit": 200},
 }
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
-
-
-def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    return pwd_context.hash(password)
+def _token_digest(token: str) -> bytes:
+    """Cache key for a bearer token, so raw tokens are not kept in memory"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
 
 
 def create_access_token(
@@ -54,15 +85,24 @@ def create_access_token(
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
 
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm="HS256")
+    encoded_jwt = jwt.encode(to_encode, _JWT_SIGNING_KEY, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
 
 def verify_token(token: str) -> dict:
-    """Verify and decode a JWT token"""
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+    """Verify and decode a JWT token
+
+    Decoded payloads are memoized until the token expires, so a token is
+    only signature-checked once.
+    """
+    digest = _token_digest(token)
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(digest)
+    if payload is not None:
         return payload
+
+    try:
+        payload = jwt.decode(token, _JWT_SIGNING_KEY, algorithms=[JWT_ALGORITHM])
     except JWTError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -70,6 +110,10 @@ def verify_token(token: str) -> dict:
             headers={"WWW-Authenticate": "Bearer"},
         ) from exc
 
+    with _jwt_cache_lock:
+        _jwt_cache[digest] = payload
+    return payload
+
 
 def get_db_session() -> Session:
     """Get database session for auth operations"""
@@ -77,18 +121,56 @@ def get_db_session() -> Session:
 
 
 def verify_api_key(api_key: str) -> dict:
-    """Verify an API key against the database and return client information"""
-    # First check hardcoded keys for backward compatibility
-    if api_key in VALID_API_KEYS:
-        client_info = VALID_API_KEYS[api_key]
-        if client_info["active"]:
-            return {
-                "api_key": api_key,
-                "client_name": client_info["name"],
-                "rate_limit": client_info["rate_limit"]
-            }
-
-    # Check database for API key
+    """Verify an API key against the database and return client information
+
+    Validated database keys are served from Redis for
+    ``API_KEY_CACHE_TTL_SECONDS``; usage is counted separately per request.
+    """
+    # Built-in demo keys are only accepted in debug mode
+    if settings.debug and api_key in _DEMO_KEYS:
+        client_info = _DEMO_KEYS[api_key]
+        return {
+            "api_key": api_key,
+            "client_name": client_info["name"],
+            "rate_limit": client_info["rate_limit"]
+        }
+
+    cache_key = _api_key_cache_key(api_key)
+    try:
+        cached = redis_client.get(cache_key)
+    except Exception as e:
+        logger.warning("API key cache unavailable", error=str(e))
+        cached = None
+
+    if cached:
+        record = json.loads(cached)
+        if record["expires_at"] is not None and record["expires_at"] < time.time():
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="API key has expired"
+            )
+    else:
+        record = _load_api_key(api_key)
+        try:
+            redis_client.setex(cache_key, API_KEY_CACHE_TTL_SECONDS, json.dumps(record))
+        except Exception as e:
+            logger.warning("API key cache unavailable", error=str(e))
+
+    return {
+        "api_key": api_key,
+        "client_name": record["name"],
+        "rate_limit": record["rate_limit"],
+        "key_id": record["id"]
+    }
+
+
+def _api_key_cache_key(api_key: str) -> str:
+    """Redis key holding the validated record for an API key"""
+    return f"tvdb:auth:key:{hashlib.sha256(api_key.encode()).hexdigest()}"
+
+
+def _load_api_key(api_key: str) -> dict:
+    """Look up and validate a database API key, returning its cacheable record"""
     db = get_db_session()
     try:
         db_key = db.query(ApiKey).filter(ApiKey.key == api_key).first()
@@ -109,22 +191,16 @@ def verify_api_key(api_key: str) -> dict:
                 detail=detail
             )
 
-        # Update usage statistics
-        db_key.last_used = datetime.utcnow()
-        db_key.total_requests += 1
-        db.commit()
-
         return {
-            "api_key": api_key,
-            "client_name": db_key.name,
+            "id": db_key.id,
+            "name": db_key.name,
             "rate_limit": db_key.rate_limit,
-            "key_id": db_key.id
+            "expires_at": db_key.expires_at.timestamp() if db_key.expires_at else None,
         }
 
     except HTTPException:
         raise
     except Exception as e:
-        logger = structlog.get_logger()
         logger.error(
             "Database error during API key verification",
             error=str(e))
@@ -136,17 +212,105 @@ def verify_api_key(api_key: str) -> dict:
         db.close()
 
 
-def get_current_client(
+async def record_api_key_usage(key_id: int):
+    """Count a request against a database API key in Redis"""
+    try:
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            pipe.hincrby(API_KEY_USAGE_REQUESTS, key_id, 1)
+            pipe.hset(API_KEY_USAGE_LAST_USED, key_id, int(time.time()))
+            await pipe.execute()
+    except Exception as e:
+        logger.warning("Failed to record API key usage", key_id=key_id, error=str(e))
+
+
+def forget_client(token: str):
+    """Drop a cached client so changes to its API key take effect.
+
+    This worker forgets it at once; other workers drop their cached clients
+    on their next revocation check, within REVOCATION_CHECK_INTERVAL_SECONDS.
+    If Redis is unreachable they keep it for up to CLIENT_CACHE_TTL_SECONDS.
+    """
+    with _client_cache_lock:
+        _client_cache.pop(_token_digest(token), None)
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.delete(_api_key_cache_key(token))
+        pipe.incr(REVOCATION_GENERATION_KEY)
+        pipe.execute()
+    except Exception as e:
+        logger.warning("API key cache unavailable", error=str(e))
+
+
+async def _check_revocations():
+    """Clear the client cache if another worker has revoked a key since the last check"""
+    global _revocation_generation, _revocation_checked_at  # pylint: disable=global-statement
+    now = time.monotonic()
+    if now - _revocation_checked_at < REVOCATION_CHECK_INTERVAL_SECONDS:
+        return
+    _revocation_checked_at = now
+
+    try:
+        generation = await async_redis_client.get(REVOCATION_GENERATION_KEY)
+    except Exception as e:
+        logger.warning("API key revocations unavailable", error=str(e))
+        return
+
+    if generation != _revocation_generation:
+        with _client_cache_lock:
+            _client_cache.clear()
+        _revocation_generation = generation
+
+
+async def get_current_client(
+        request: Request,
         credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
-    """Dependency to get current authenticated client"""
+    """Dependency to get current authenticated client
+
+    Runs on the event loop so the client it binds into the structlog context
+    is visible to the rest of the request; only a cache miss, which may hit
+    the database, is moved to a worker thread. The client's identity is left
+    on ``request.state`` for the rate limiter.
+    """
     token = credentials.credentials
+    digest = _token_digest(token)
+
+    await _check_revocations()
+    with _client_cache_lock:
+        client = _client_cache.get(digest)
+
+    # JWT clients must not outlive their token's expiry while cached
+    if client is None or client.get("exp", float("inf")) <= time.time():
+        client = await asyncio.to_thread(_resolve_client, token)
+        with _client_cache_lock:
+            _client_cache[digest] = client
+
+    if "key_id" in client:
+        await record_api_key_usage(client["key_id"])
+
+    request.state.client_identity = _client_identity(client)
+    structlog.contextvars.bind_contextvars(client=client.get("client_name"))
+    return client
 
-    # Try to verify as JWT token first
-    try:
-        payload = verify_token(token)
-        return payload
-    except HTTPException:
-        pass
+
+def _client_identity(client: dict) -> str:
+    """Stable identity of the API key behind a client.
+
+    Raw API keys and every JWT minted from one (whose ``sub`` is the key)
+    map to the same value, so they share one rate limit bucket.
+    """
+    api_key = client.get("api_key") or client.get("sub") or ""
+    return hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+
+
+def _resolve_client(token: str) -> dict:
+    """Authenticate a bearer token as a JWT or an API key"""
+    # Try to verify as JWT token first; API keys never have the three
+    # dot-separated JWT segments, so skip the decode attempt for them
+    if token.count(".") == 2:
+        try:
+            return verify_token(token)
+        except HTTPException:
+            pass
 
     # If JWT fails, try as API key
     try:
@@ -159,16 +323,14 @@ def get_current_client(
         ) from exc
 
 
-def require_admin(
-        credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+def require_admin(client: dict = Depends(get_current_client)) -> dict:
     """Require admin authentication"""
-    client = get_current_client(credentials)
-
     # Check if client has admin privileges
     # For now, we'll check against a hardcoded admin key
     # In production, this should check a role/permission in the database
     admin_key = client.get("api_key") or client.get("sub")  # JWT tokens use 'sub' field
-    if admin_key != "admin-super-key-change-in-production":
+    if not hmac.compare_digest(
+            (admin_key or "").encode(), b"admin-super-key-change-in-production"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -11,9 +11,17 @@ class Settings(BaseSettings):
     # Database Configuration
     database_url: str
     test_database_url: Optional[str] = None
+    db_pool_size: int = 10  # Connections kept open per process
+    db_max_overflow: int = 20  # Extra connections allowed under burst load
+    db_pool_recycle_seconds: int = 1800  # Replace connections older than this
+    # Fraction of SQL statements logged at DEBUG (default: all in debug mode,
+    # 1% otherwise)
+    sql_log_sample_rate: Optional[float] = None
 
     # Redis Configuration
     redis_url: str = "redis://localhost:6379/0"
+    redis_max_connections: int = 64  # Per client, per process
+    redis_pool_timeout_seconds: float = 5.0  # Wait for a free connection
 
     # API Configuration
     secret_key: str
@@ -37,6 +45,8 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
     structured_logging: bool = True
+    log_batch_size: int = 256  # Records per write from the log writer thread
+    log_batch_max_wait_ms: int = 10  # Max time a record waits for its batch
 
     # Application
     app_name: str = "TVDB Proxy"
@@ -52,6 +62,9 @@ class Settings(BaseSettings):
     s3_use_ssl: bool = True
     s3_verify_ssl: bool = True
     cdn_base_url: Optional[str] = None  # Optional CDN URL for serving images
+    # Serve image bodies through nginx using X-Accel-Redirect
+    use_x_accel: bool = False
+    x_accel_prefix: str = "/_internal/images/"  # Internal nginx location for images
 
     # Storage Backend Selection
     storage_backend: str = "s3"  # Options: "s3", "local", "none"
@@ -65,10 +78,13 @@ class Settings(BaseSettings):
     image_sync_retry_failed: bool = True
     image_sync_retry_after_hours: int = 24
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-        extra = "ignore"
+    # Loaded once at import; nothing should reassign settings at runtime
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True,
+    )
 
 
 settings = Settings()
@@ -1,21 +1,65 @@
-from sqlalchemy import create_engine
+import logging
+import random
+
+import structlog
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from app.config import settings
 
+logger = structlog.get_logger()
+# Level checks go through stdlib: the structlog logger only gains isEnabledFor
+# once configure_logging() has run, which Celery workers and scripts skip
+_stdlib_logger = logging.getLogger(__name__)
+
 # Create database engine
 engine = create_engine(
     settings.database_url,
-    poolclass=StaticPool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle_seconds,
     pool_pre_ping=True,
-    echo=settings.debug,
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for endpoints that should not block the event loop on the DB
+async_engine = create_async_engine(
+    make_url(settings.database_url).set(drivername="postgresql+asyncpg"),
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle_seconds,
+    pool_pre_ping=True,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False)
+
+# Fraction of statements logged at DEBUG; all of them in debug mode
+SQL_LOG_SAMPLE_RATE = (
+    settings.sql_log_sample_rate if settings.sql_log_sample_rate is not None
+    else 1.0 if settings.debug else 0.01
+)
+
+
+def _log_sampled_statement(conn, cursor, statement, parameters, context, executemany):
+    """Log a sample of executed statements through structlog"""
+    if not _stdlib_logger.isEnabledFor(logging.DEBUG) or random.random() >= SQL_LOG_SAMPLE_RATE:
+        return
+    # Parameters can carry API keys, so they are only logged in debug mode
+    if settings.debug:
+        logger.debug("SQL statement", statement=statement, parameters=parameters)
+    else:
+        logger.debug("SQL statement", statement=statement)
+
+
+for _engine in (engine, async_engine.sync_engine):
+    event.listen(_engine, "before_cursor_execute", _log_sampled_statement)
+
 # Create base class for models
 Base = declarative_base()
 
@@ -29,6 +73,24 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Dependency for getting an async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def create_tables():
-    """Create all tables"""
-    Base.metadata.create_all(bind=engine)
+    """Create all tables
+
+    Existing tables are looked up once, so a warm start with the schema
+    already in place issues no DDL and creates no indexes. Missing tables
+    (and their indexes) are created serially on a single connection.
+    """
+    with engine.begin() as connection:
+        existing = set(inspect(connection).get_table_names())
+        missing = [
+            table for table in Base.metadata.sorted_tables
+            if table.name not in existing
+        ]
+        if missing:
+            Base.metadata.create_all(bind=connection, tables=missing, checkfirst=False)
@@ -0,0 +1,223 @@
+"""Logging setup: structlog front end feeding a queue-backed stdlib handler.
+
+Request handlers only build an event dict and enqueue it; rendering and the
+write to stdout happen on a background writer thread, which drains the queue
+in batches and issues one write per batch.
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+import orjson
+import structlog
+
+from app.config import settings
+
+# Maximum number of records buffered between the event loop and the writer
+LOG_QUEUE_SIZE = 10000
+
+_log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+_writer: Optional["_BatchingLogWriter"] = None
+
+
+class _EventQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records without formatting them.
+
+    The stock handler formats each record before enqueueing, which would run
+    the renderer on the caller's thread; that is left to the writer thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        """Enqueue a record, dropping the oldest one if the queue is full"""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                pass
+
+
+class _BatchingLogWriter:
+    """Drains the log queue on a background thread and writes in batches.
+
+    A batch is flushed once it holds ``batch_size`` records or ``max_wait``
+    seconds have passed since its first record arrived.
+    """
+
+    _STOP = object()
+
+    def __init__(self, log_queue: queue.Queue, formatter: logging.Formatter,
+                 stream, batch_size: int, max_wait: float):
+        self._queue = log_queue
+        self._formatter = formatter
+        self._stream = stream
+        self._batch_size = max(1, batch_size)
+        self._max_wait = max(0.0, max_wait)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Flush everything queued so far and wait for the thread to exit"""
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._batch_size and batch[-1] is not self._STOP:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            stopping = batch[-1] is self._STOP
+            if stopping:
+                batch.pop()
+
+            lines = [line for line in map(self._format, batch) if line is not None]
+            if lines:
+                self._write(b"\n".join(lines) + b"\n")
+
+            if stopping:
+                return
+
+    def _format(self, record: logging.LogRecord) -> Optional[bytes]:
+        try:
+            return self._formatter.format(record).encode("utf-8", "replace")
+        except Exception:  # pylint: disable=broad-exception-caught
+            traceback.print_exc(file=sys.stderr)
+            return None
+
+    def _write(self, data: bytes):
+        try:
+            fd = self._stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            # Stream without a file descriptor (e.g. captured in tests)
+            self._stream.write(data.decode("utf-8", "replace"))
+            self._stream.flush()
+            return
+
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+
+def _stringify_url(_logger, _method_name, event_dict):
+    """Render a URL object passed as ``url`` on the writer thread"""
+    url = event_dict.get("url")
+    if url is not None and not isinstance(url, str):
+        event_dict["url"] = str(url)
+    return event_dict
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """JSONRenderer serializer backed by orjson"""
+    return orjson.dumps(obj, default=kwargs.get("default"),
+                        option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _build_formatter() -> logging.Formatter:
+    """Formatter run on the writer thread to render records"""
+    renderer = (
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+        if settings.structured_logging
+        else structlog.dev.ConsoleRenderer()
+    )
+    return structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            _stringify_url,
+            structlog.processors.UnicodeDecoder(),
+            renderer,
+        ],
+        # Records from plain stdlib loggers (uvicorn, sqlalchemy, ...)
+        foreign_pre_chain=[
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+        ],
+    )
+
+
+def configure_logging():
+    """Configure structlog and route the root logger through the queue"""
+    structlog.configure(
+        processors=[
+            # Drop disabled levels before any other work is done
+            structlog.stdlib.filter_by_level,
+            # Request context bound by the logging middleware and auth
+            structlog.contextvars.merge_contextvars,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            # Stack and exception info must be captured on the calling thread
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+
+    root = logging.getLogger()
+    root.handlers = [_EventQueueHandler(_log_queue)]
+    root.setLevel(settings.log_level.upper())
+
+
+def start_log_listener():
+    """Start the background thread that renders and writes queued records.
+
+    The thread is a daemon, so it is also stopped at interpreter exit; that
+    flushes records logged when startup fails and shutdown hooks never run.
+    """
+    global _writer  # pylint: disable=global-statement
+    if _writer is not None:
+        return
+
+    _writer = _BatchingLogWriter(
+        _log_queue,
+        _build_formatter(),
+        sys.stdout,
+        batch_size=settings.log_batch_size,
+        max_wait=settings.log_batch_max_wait_ms / 1000,
+    )
+    _writer.start()
+    atexit.register(stop_log_listener)
+
+
+def stop_log_listener():
+    """Flush queued records and stop the writer thread"""
+    global _writer  # pylint: disable=global-statement
+    if _writer is None:
+        return
+
+    atexit.unregister(stop_log_listener)
+    _writer.stop()
+    _writer = None
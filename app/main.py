@@ -1,57 +1,67 @@
+import asyncio
+import logging
 import time
+import uuid
 
 import structlog
+from cachetools import TTLCache
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
+from sqlalchemy.orm import configure_mappers
 
 from app.api.endpoints.images import router as images_router
 from app.api.routes import api_router
+from app.api.utils.rate_limit import limiter
 from app.config import settings
 from app.database import create_tables
-from app.redis_client import cache
+from app.logging_config import (configure_logging, start_log_listener,
+                                stop_log_listener)
+from app.redis_client import async_cache, async_redis_client
+from app.services.tvdb_client import tvdb_client
 from app.tvdb_routes import tvdb_router
 
 # Configure structured logging
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
-        if settings.structured_logging
-        else structlog.dev.ConsoleRenderer(),
-    ],
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
+configure_logging()
 
 logger = structlog.get_logger()
 
-# Rate limiter
-limiter = Limiter(key_func=get_remote_address)
-
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.version,
     description="A high-performance caching proxy for TVDB API v4",
     openapi_url=f"{settings.api_v1_prefix}/openapi.json" if settings.debug else None,
+    default_response_class=ORJSONResponse,
 )
 
 # Add rate limiting
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+
+class JSONGZipMiddleware:
+    """Gzip responses, except image routes whose bodies are already compressed"""
+
+    IMAGE_PATH_PREFIXES = ("/images/", f"{settings.api_v1_prefix}/images/")
+
+    def __init__(self, app, minimum_size: int = 512):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not scope["path"].startswith(self.IMAGE_PATH_PREFIXES):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+# Compress JSON responses before egress
+app.add_middleware(JSONGZipMiddleware, minimum_size=512)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -65,20 +75,30 @@ app.add_middleware(
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    start_time = time.time()
+    start_time = time.perf_counter()
+
+    # Bind request context once; every log line in the request inherits it
+    request_id = uuid.uuid4().hex
+    request.state.request_id = request_id
+    structlog.contextvars.clear_contextvars()
+    structlog.contextvars.bind_contextvars(
+        request_id=request_id,
+        method=request.method,
+        path=request.url.path,
+    )
 
     response = await call_next(request)
 
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
 
-    logger.info(
-        "Request processed",
-        method=request.method,
-        url=str(request.url),
-        status_code=response.status_code,
-        process_time=round(process_time, 4),
-        client_host=request.client.host if request.client else None,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Request processed",
+            url=request.url,  # Stringified when the record is rendered
+            status_code=response.status_code,
+            process_time=round(process_time, 4),
+            client_host=request.client.host if request.client else None,
+        )
 
     response.headers["X-Process-Time"] = str(process_time)
     return response
@@ -87,41 +107,59 @@ async def log_requests(request: Request, call_next):
 # Startup event
 @app.on_event("startup")
 async def startup_event():
+    start_log_listener()
     logger.info("Starting TVDB Proxy API", version=settings.version)
 
-    # Create database tables
-    try:
-        create_tables()
+    # Resolve every model relationship now rather than on the first query
+    configure_mappers()
+
+    # Create database tables and test the Redis connection concurrently, off
+    # the event loop
+    tables_result, redis_result = await asyncio.gather(
+        asyncio.to_thread(create_tables),
+        async_redis_client.ping(),
+        return_exceptions=True,
+    )
+
+    if isinstance(tables_result, Exception):
+        logger.error("Failed to create database tables", error=str(tables_result))
+    else:
         logger.info("Database tables created/verified")
-    except Exception as e:
-        logger.error("Failed to create database tables", error=str(e))
-        raise
 
-    # Test Redis connection
-    try:
-        cache.client.ping()
+    if isinstance(redis_result, Exception):
+        logger.error("Failed to connect to Redis", error=str(redis_result))
+    else:
         logger.info("Redis connection established")
-    except Exception as e:
-        logger.error("Failed to connect to Redis", error=str(e))
-        raise
+
+    for result in (tables_result, redis_result):
+        if isinstance(result, Exception):
+            raise result
 
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Shutting down TVDB Proxy API")
+    await async_redis_client.aclose(close_connection_pool=True)
+    tvdb_client.close()
+    stop_log_listener()
+
+
+# Health check endpoint; the latest result is served for a couple of seconds
+_health_cache = TTLCache(maxsize=1, ttl=2)
 
 
-# Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    try:
-        # Check Redis
-        cache.client.ping()
-        redis_status = "healthy"
-    except Exception:
-        redis_status = "unhealthy"
+    # Probes can arrive in bursts, so the answer is reused briefly
+    cached = _health_cache.get("health")
+    if cached is not None:
+        return cached
+
+    # Check Redis: ping and stats share one pipelined round trip
+    cache_stats = await async_cache.get_cache_stats()
+    redis_status = "healthy" if cache_stats is not None else "unhealthy"
 
     # Check database would go here
     db_status = "healthy"  # Simplified for now
@@ -131,15 +169,17 @@ async def health_check():
         else "unhealthy"
     )
 
-    return {
+    health = {
         "status": overall_status,
         "version": settings.version,
         "services": {
             "redis": redis_status,
             "database": db_status,
         },
-        "cache_stats": cache.get_cache_stats()
+        "cache_stats": cache_stats or {}
     }
+    _health_cache["health"] = health
+    return health
 
 
 # Root endpoint
@@ -174,11 +214,12 @@ async def global_exception_handler(request: Request, exc: Exception):
         "Unhandled exception",
         error=str(exc),
         path=request.url.path,
+        path_params=request.path_params,
         method=request.method,
         exc_info=exc,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
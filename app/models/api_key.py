@@ -1,7 +1,9 @@
 import secrets
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy import (Boolean, Column, DateTime, Integer, String, Text, and_,
+                        func, text)
+from sqlalchemy.ext.hybrid import hybrid_property
 
 from app.models.base import BaseModel
 
@@ -15,21 +17,21 @@ class ApiKey(BaseModel):
     description = Column(Text)
 
     # Access control
-    active = Column(Boolean, default=True, nullable=False)
+    active = Column(Boolean, server_default=text('true'), nullable=False)
     rate_limit = Column(
         Integer,
-        default=100,
+        server_default=text('100'),
         nullable=False)  # requests per minute
 
     # Usage tracking
     last_used = Column(DateTime(timezone=True))
-    total_requests = Column(Integer, default=0, nullable=False)
+    total_requests = Column(Integer, server_default=text('0'), nullable=False)
 
     # Expiration (optional)
     expires_at = Column(DateTime(timezone=True))
 
     # PIN support (for user-supported keys)
-    requires_pin = Column(Boolean, default=False, nullable=False)
+    requires_pin = Column(Boolean, server_default=text('false'), nullable=False)
     pin = Column(String(20))  # Optional PIN for user-supported keys
 
     # Admin fields
@@ -40,12 +42,20 @@ class ApiKey(BaseModel):
         """Generate a secure API key"""
         return f"{prefix}-{secrets.token_urlsafe(24)}"
 
-    @property
+    @hybrid_property
     def is_expired(self) -> bool:
         """Check if the API key has expired"""
         if not self.expires_at:
             return False
-        return self.expires_at < datetime.utcnow()
+        # Loaded values are timezone-aware; a naive value is one assigned as UTC
+        if self.expires_at.tzinfo is None:
+            return self.expires_at < datetime.utcnow()
+        return self.expires_at < datetime.now(timezone.utc)
+
+    @is_expired.expression
+    def is_expired(cls):  # pylint: disable=no-self-argument
+        """SQL form of ``is_expired`` for use in queries"""
+        return and_(cls.expires_at.isnot(None), cls.expires_at < func.now())
 
     @property
     def is_valid(self) -> bool:
@@ -53,19 +63,23 @@ class ApiKey(BaseModel):
         return self.active and not self.is_expired
 
     def to_dict(self, include_key: bool = False) -> dict:
-        """Convert to dictionary, optionally including the actual key"""
+        """Convert to dictionary, optionally including the actual key
+
+        Timestamps are left as datetimes for the response schema and JSON
+        encoder to handle, rather than formatted here and parsed back.
+        """
         data = {
             "id": self.id,
             "name": self.name,
             "description": self.description,
             "active": self.active,
             "rate_limit": self.rate_limit,
-            "last_used": self.last_used.isoformat() if self.last_used else None,
+            "last_used": self.last_used,
             "total_requests": self.total_requests,
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "expires_at": self.expires_at,
             "created_by": self.created_by,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
             "requires_pin": self.requires_pin,
             "has_pin": bool(self.pin),  # Don't expose actual PIN
         }
@@ -1,9 +1,9 @@
-from sqlalchemy import (Boolean, Column, DateTime, Float, ForeignKey, Integer,
-                        String)
+from sqlalchemy import (Boolean, Column, DateTime, Float, ForeignKey, Index,
+                        Integer, String, text)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, TVDBImageUrl
 
 
 class Artwork(BaseModel):
@@ -12,20 +12,21 @@ class Artwork(BaseModel):
     # Core identifiers
     tvdb_id = Column(Integer, unique=True, index=True, nullable=False)
 
-    # Content relationships (one artwork can belong to one content type)
-    series_id = Column(Integer, ForeignKey('series.id'), index=True)
-    season_id = Column(Integer, ForeignKey('seasons.id'), index=True)
-    episode_id = Column(Integer, ForeignKey('episodes.id'), index=True)
-    movie_id = Column(Integer, ForeignKey('movies.id'), index=True)
-    person_id = Column(Integer, ForeignKey('people.id'), index=True)
+    # Content relationships (one artwork can belong to one content type);
+    # indexed by the partial indexes in __table_args__
+    series_id = Column(Integer, ForeignKey('series.id'))
+    season_id = Column(Integer, ForeignKey('seasons.id'))
+    episode_id = Column(Integer, ForeignKey('episodes.id'))
+    movie_id = Column(Integer, ForeignKey('movies.id'))
+    person_id = Column(Integer, ForeignKey('people.id'))
 
     # Artwork classification
     type_id = Column(Integer, ForeignKey('artwork_types.id'), nullable=False)
     language_id = Column(Integer, ForeignKey('languages.id'))
 
     # Image information
-    image_url = Column(String(500), nullable=False)
-    thumbnail_url = Column(String(500))
+    image_url = Column(TVDBImageUrl(), nullable=False)
+    thumbnail_url = Column(TVDBImageUrl())
 
     # Dimensions and quality
     width = Column(Integer)
@@ -33,9 +34,9 @@ class Artwork(BaseModel):
     resolution = Column(String(20))  # 1920x1080, etc.
 
     # Metadata
-    score = Column(Float, default=0.0)
-    is_primary = Column(Boolean, default=False)
-    include_text = Column(Boolean, default=True)
+    score = Column(Float, server_default=text('0'))
+    is_primary = Column(Boolean, server_default=text('false'))
+    include_text = Column(Boolean, server_default=text('true'))
 
     # Extended metadata
     tags = Column(JSONB)
@@ -60,5 +61,13 @@ class Artwork(BaseModel):
     type = relationship("ArtworkType", back_populates="artwork")
     language = relationship("Language", back_populates="artwork")
 
+    # One (owner, type, is_primary) index per owner column, covering only the
+    # rows that owner column is set on
+    __table_args__ = tuple(
+        Index(f'idx_artwork_{column}_type_primary', column, 'type_id', 'is_primary',
+              postgresql_where=text(f'{column} IS NOT NULL'))
+        for column in ('series_id', 'season_id', 'episode_id', 'movie_id', 'person_id')
+    )
+
     def __repr__(self):
         return f"<Artwork(tvdb_id={self.tvdb_id}, type_id={self.type_id})>"
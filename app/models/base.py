@@ -1,8 +1,37 @@
-from sqlalchemy import Column, DateTime, Integer
+from functools import cache
+from operator import attrgetter
+
+from sqlalchemy import Column, DateTime, Integer, String
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 
 from app.database import Base
 
+# Host every TVDB artwork URL starts with; stored rows keep only the path
+TVDB_ARTWORK_HOST = "https://artworks.thetvdb.com"
+
+
+class TVDBImageUrl(TypeDecorator):
+    """String column for TVDB artwork URLs that stores them without the host.
+
+    Almost every value shares the same artwork host, so only the path after
+    it is written, keeping rows and their pages smaller. URLs on any other
+    host are stored unchanged. Values read back are full URLs again.
+    """
+
+    impl = String(500)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value and value.startswith(TVDB_ARTWORK_HOST + "/"):
+            return value[len(TVDB_ARTWORK_HOST):]
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value and value.startswith("/"):
+            return TVDB_ARTWORK_HOST + value
+        return value
+
 
 class TimestampMixin:
     """Mixin for adding timestamp fields to models"""
@@ -16,9 +45,18 @@ class BaseModel(Base, TimestampMixin):
 
     id = Column(Integer, primary_key=True, index=True)
 
+    @classmethod
+    @cache
+    def _column_names(cls) -> tuple:
+        """Names of the table's columns, computed once per model"""
+        return tuple(column.name for column in cls.__table__.columns)
+
+    @classmethod
+    @cache
+    def _column_getter(cls) -> attrgetter:
+        """Getter returning every column value of an instance as a tuple"""
+        return attrgetter(*cls._column_names())
+
     def to_dict(self):
         """Convert model instance to dictionary"""
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        return dict(zip(self._column_names(), self._column_getter()(self)))
@@ -1,5 +1,5 @@
 from sqlalchemy import (Boolean, Column, DateTime, ForeignKey, Integer, String,
-                        Text)
+                        Text, text)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -25,7 +25,7 @@ class Character(BaseModel):
     person_id = Column(Integer, ForeignKey('people.id'), index=True)
 
     # Character details
-    is_featured = Column(Boolean, default=False)
+    is_featured = Column(Boolean, server_default=text('false'))
     sort_order = Column(Integer)
     character_type = Column(String(50))  # main, guest, recurring, etc.
 
@@ -38,7 +38,7 @@ class Character(BaseModel):
 
     # Cache control
     last_synced = Column(DateTime(timezone=True))
-    needs_full_sync = Column(Boolean, default=False)
+    needs_full_sync = Column(Boolean, server_default=text('false'))
 
     # Relationships
     series = relationship("Series", back_populates="characters")
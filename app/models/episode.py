@@ -1,9 +1,9 @@
 from sqlalchemy import (Boolean, Column, DateTime, Float, ForeignKey, Integer,
-                        String, Text)
+                        String, Text, text)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, TVDBImageUrl
 
 
 class Episode(BaseModel):
@@ -38,8 +38,8 @@ class Episode(BaseModel):
     rating = Column(Float)
 
     # Images
-    image = Column(String(500))
-    thumbnail = Column(String(500))
+    image = Column(TVDBImageUrl())
+    thumbnail = Column(TVDBImageUrl())
 
     # Local image URLs
     local_image_url = Column(String(500))
@@ -53,7 +53,7 @@ class Episode(BaseModel):
 
     # Cache control
     last_synced = Column(DateTime(timezone=True))
-    needs_full_sync = Column(Boolean, default=False)
+    needs_full_sync = Column(Boolean, server_default=text('false'))
 
     # Relationships
     series = relationship("Series", back_populates="episodes")
@@ -1,9 +1,9 @@
 from sqlalchemy import (Boolean, Column, DateTime, Float, ForeignKey, Integer,
-                        String, Table, Text)
+                        String, Table, Text, text)
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import relationship
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, TVDBImageUrl
 
 # Association tables for many-to-many relationships
 movie_genres = Table(
@@ -53,10 +53,10 @@ class Movie(BaseModel):
     revenue = Column(String(100))
 
     # Images and artwork
-    image = Column(String(500))
-    poster = Column(String(500))
-    fanart = Column(String(500))
-    banner = Column(String(500))
+    image = Column(TVDBImageUrl())
+    poster = Column(TVDBImageUrl())
+    fanart = Column(TVDBImageUrl())
+    banner = Column(TVDBImageUrl())
 
     # Local image URLs
     local_image_url = Column(String(500))
@@ -72,7 +72,7 @@ class Movie(BaseModel):
 
     # Cache control
     last_synced = Column(DateTime(timezone=True))
-    needs_full_sync = Column(Boolean, default=False)
+    needs_full_sync = Column(Boolean, server_default=text('false'))
 
     # Relationships
     status = relationship("MovieStatus", back_populates="movies")
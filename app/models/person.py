@@ -1,9 +1,9 @@
 from sqlalchemy import (Boolean, Column, DateTime, ForeignKey, Integer, String,
-                        Text)
+                        Text, text)
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import relationship
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, TVDBImageUrl
 
 
 class Person(BaseModel):
@@ -27,7 +27,7 @@ class Person(BaseModel):
     gender_id = Column(Integer, ForeignKey('genders.id'))
 
     # Images
-    image = Column(String(500))
+    image = Column(TVDBImageUrl())
 
     # Local image URL
     local_image_url = Column(String(500))
@@ -40,7 +40,7 @@ class Person(BaseModel):
 
     # Cache control
     last_synced = Column(DateTime(timezone=True))
-    needs_full_sync = Column(Boolean, default=False)
+    needs_full_sync = Column(Boolean, server_default=text('false'))
 
     # Relationships
     type = relationship("PersonType", back_populates="people")
@@ -1,9 +1,9 @@
-from sqlalchemy import (Boolean, Column, DateTime, ForeignKey, Integer, String,
-                        Text)
+from sqlalchemy import (Boolean, Column, DateTime, ForeignKey, Index, Integer,
+                        String, Text, text)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, TVDBImageUrl
 
 
 class Season(BaseModel):
@@ -11,16 +11,16 @@ class Season(BaseModel):
 
     # Core identifiers
     tvdb_id = Column(Integer, unique=True, index=True, nullable=False)
+    # Indexed as the leading column of the (series_id, number) index
     series_id = Column(
         Integer,
         ForeignKey('series.id'),
-        nullable=False,
-        index=True)
+        nullable=False)
 
     # Basic information
     name = Column(String(500))
     overview = Column(Text)
-    number = Column(Integer, nullable=False, index=True)
+    number = Column(Integer, nullable=False)
     season_type = Column(String(50))  # official, dvd, absolute, etc.
 
     # Metadata
@@ -28,8 +28,8 @@ class Season(BaseModel):
     air_date = Column(DateTime(timezone=True))
 
     # Images
-    image = Column(String(500))
-    poster = Column(String(500))
+    image = Column(TVDBImageUrl())
+    poster = Column(TVDBImageUrl())
 
     # Local image URLs
     local_image_url = Column(String(500))
@@ -41,7 +41,7 @@ class Season(BaseModel):
 
     # Cache control
     last_synced = Column(DateTime(timezone=True))
-    needs_full_sync = Column(Boolean, default=False)
+    needs_full_sync = Column(Boolean, server_default=text('false'))
 
     # Relationships
     series = relationship("Series", back_populates="seasons")
@@ -54,5 +54,14 @@ class Season(BaseModel):
         back_populates="season",
         cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Season N of a series in one index descent; not unique, as official,
+        # DVD and absolute orderings reuse season numbers
+        Index('ix_seasons_series_id_number', 'series_id', 'number'),
+        # GIN index for containment (@>) lookups on translations
+        Index('ix_seasons_translations_gin', 'translations', postgresql_using='gin',
+              postgresql_ops={'translations': 'jsonb_path_ops'}),
+    )
+
     def __repr__(self):
         return f"<Season(tvdb_id={self.tvdb_id}, series_id={self.series_id}, number={self.number})>"
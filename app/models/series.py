@@ -1,9 +1,9 @@
-from sqlalchemy import (Boolean, Column, DateTime, Float, ForeignKey, Integer,
-                        String, Table, Text)
+from sqlalchemy import (Boolean, Column, DateTime, Float, ForeignKey, Index,
+                        Integer, String, Table, Text, text)
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import relationship
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, TVDBImageUrl
 
 # Association tables for many-to-many relationships
 series_genres = Table(
@@ -51,10 +51,10 @@ class Series(BaseModel):
     popularity = Column(Float, index=True)
 
     # Images and artwork
-    image = Column(String(500))
-    banner = Column(String(500))
-    poster = Column(String(500))
-    fanart = Column(String(500))
+    image = Column(TVDBImageUrl())
+    banner = Column(TVDBImageUrl())
+    poster = Column(TVDBImageUrl())
+    fanart = Column(TVDBImageUrl())
 
     # Local image URLs
     local_image_url = Column(String(500))
@@ -70,7 +70,7 @@ class Series(BaseModel):
 
     # Cache control
     last_synced = Column(DateTime(timezone=True))
-    needs_full_sync = Column(Boolean, default=False)
+    needs_full_sync = Column(Boolean, server_default=text('false'))
 
     # Relationships
     status = relationship("SeriesStatus", back_populates="series")
@@ -101,5 +101,13 @@ class Series(BaseModel):
         secondary=series_companies,
         back_populates="series")
 
+    # GIN indexes for containment (@>) lookups; jsonb_path_ops supports only
+    # containment but is about half the size of the default jsonb_ops
+    __table_args__ = (
+        Index('ix_series_translations_gin', 'translations', postgresql_using='gin',
+              postgresql_ops={'translations': 'jsonb_path_ops'}),
+        Index('ix_series_tags_gin', 'tags', postgresql_using='gin'),
+    )
+
     def __repr__(self):
         return f"<Series(tvdb_id={self.tvdb_id}, name='{self.name}')>"
@@ -1,16 +1,51 @@
-import json
+import threading
 from datetime import timedelta
-from typing import Any, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
+import orjson
 import redis
+import redis.asyncio
 import structlog
+from cachetools import TTLCache
 
 from app.config import settings
 
 logger = structlog.get_logger()
 
-# Redis connection
-redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+# Commands sent per round trip by the batched cache writes
+CACHE_PIPELINE_BATCH_SIZE = 1000
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a cache value; unknown types and non-string keys become strings"""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Redis connection. Both clients draw from bounded pools that make callers wait
+# for a free connection instead of opening new ones without limit under load
+redis_client = redis.Redis(connection_pool=redis.BlockingConnectionPool.from_url(
+    settings.redis_url,
+    max_connections=settings.redis_max_connections,
+    timeout=settings.redis_pool_timeout_seconds,
+    decode_responses=True,
+))
+
+# Non-blocking connection for request handlers on the event loop
+async_redis_client = redis.asyncio.Redis(
+    connection_pool=redis.asyncio.BlockingConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout_seconds,
+        decode_responses=False,
+    ))
+
+
+def _calculate_hit_rate(info: dict) -> float:
+    """Calculate cache hit rate from INFO output"""
+    hits = info.get("keyspace_hits", 0)
+    misses = info.get("keyspace_misses", 0)
+    total = hits + misses
+    return (hits / total * 100) if total > 0 else 0.0
 
 
 class CacheManager:
@@ -29,7 +64,7 @@ class CacheManager:
         try:
             data = self.client.get(key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
             return None
         except Exception as e:
             logger.error("Cache get error", key=key, error=str(e))
@@ -44,7 +79,7 @@ class CacheManager:
         """Set cached data with optional TTL"""
         key = self._make_key(prefix, identifier)
         try:
-            serialized = json.dumps(data, default=str)
+            serialized = _dumps(data)
             if ttl_hours:
                 return self.client.setex(
                     key, timedelta(
@@ -54,6 +89,40 @@ class CacheManager:
             logger.error("Cache set error", key=key, error=str(e))
             return False
 
+    def mget(self, prefix: str,
+             identifiers: Iterable[Union[str, int]]) -> List[Optional[Any]]:
+        """Get several cached values in one round trip, in identifier order"""
+        keys = [self._make_key(prefix, identifier) for identifier in identifiers]
+        if not keys:
+            return []
+        try:
+            return [orjson.loads(data) if data else None for data in self.client.mget(keys)]
+        except Exception as e:
+            logger.error("Cache mget error", prefix=prefix, count=len(keys), error=str(e))
+            return [None] * len(keys)
+
+    def mset(self,
+             prefix: str,
+             items: Dict[Union[str, int], Any],
+             ttl_hours: Optional[int] = None) -> bool:
+        """Set several cached values, pipelined in batches of round trips"""
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for count, (identifier, data) in enumerate(items.items(), 1):
+                key = self._make_key(prefix, identifier)
+                serialized = _dumps(data)
+                if ttl_hours:
+                    pipe.setex(key, timedelta(hours=ttl_hours), serialized)
+                else:
+                    pipe.set(key, serialized)
+                if count % CACHE_PIPELINE_BATCH_SIZE == 0:
+                    pipe.execute()
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error("Cache mset error", prefix=prefix, count=len(items), error=str(e))
+            return False
+
     def delete(self, prefix: str, identifier: Union[str, int]) -> bool:
         """Delete cached data"""
         key = self._make_key(prefix, identifier)
@@ -82,12 +151,18 @@ class CacheManager:
             return -1
 
     def flush_pattern(self, pattern: str) -> int:
-        """Delete keys matching a pattern"""
+        """Delete keys matching a pattern, scanning rather than blocking on KEYS"""
         try:
-            keys = self.client.keys(f"tvdb:{pattern}")
-            if keys:
-                return self.client.delete(*keys)
-            return 0
+            deleted = 0
+            batch = []
+            for key in self.client.scan_iter(match=f"tvdb:{pattern}", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += self.client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                deleted += self.client.unlink(*batch)
+            return deleted
         except Exception as e:
             logger.error(
                 "Cache flush pattern error",
@@ -111,14 +186,151 @@ class CacheManager:
 
     def _calculate_hit_rate(self, info: dict) -> float:
         """Calculate cache hit rate"""
-        hits = info.get("keyspace_hits", 0)
-        misses = info.get("keyspace_misses", 0)
-        total = hits + misses
-        return (hits / total * 100) if total > 0 else 0.0
+        return _calculate_hit_rate(info)
+
+
+class AsyncCacheManager:
+    """Redis cache manager for use from request handlers.
+
+    Shares the key scheme and orjson encoding of ``CacheManager``, so values
+    are interchangeable between the two.
+    """
+
+    def __init__(self):
+        self.client = async_redis_client
+
+    def _make_key(self, prefix: str, identifier: Union[str, int]) -> str:
+        """Create a standardized cache key"""
+        return f"tvdb:{prefix}:{str(identifier)}"
+
+    async def get(self, prefix: str, identifier: Union[str, int]) -> Optional[Any]:
+        """Get cached data"""
+        key = self._make_key(prefix, identifier)
+        try:
+            data = await self.client.get(key)
+            if data:
+                return orjson.loads(data)
+            return None
+        except Exception as e:
+            logger.error("Cache get error", key=key, error=str(e))
+            return None
 
+    async def set(self,
+                  prefix: str,
+                  identifier: Union[str, int],
+                  data: Any,
+                  ttl_hours: Optional[int] = None) -> bool:
+        """Set cached data with optional TTL"""
+        key = self._make_key(prefix, identifier)
+        try:
+            serialized = _dumps(data)
+            if ttl_hours:
+                return await self.client.setex(key, timedelta(hours=ttl_hours), serialized)
+            return await self.client.set(key, serialized)
+        except Exception as e:
+            logger.error("Cache set error", key=key, error=str(e))
+            return False
 
-# Global cache instance
+    async def get_raw(self, prefix: str, identifier: Union[str, int]) -> Optional[bytes]:
+        """Get cached bytes as stored, without decoding"""
+        key = self._make_key(prefix, identifier)
+        try:
+            return await self.client.get(key)
+        except Exception as e:
+            logger.error("Cache get error", key=key, error=str(e))
+            return None
+
+    async def set_raw(self,
+                      prefix: str,
+                      identifier: Union[str, int],
+                      data: bytes,
+                      ttl_hours: Optional[int] = None) -> bool:
+        """Set already-serialized bytes with optional TTL"""
+        key = self._make_key(prefix, identifier)
+        try:
+            if ttl_hours:
+                return await self.client.setex(key, timedelta(hours=ttl_hours), data)
+            return await self.client.set(key, data)
+        except Exception as e:
+            logger.error("Cache set error", key=key, error=str(e))
+            return False
+
+    async def get_cache_stats(self) -> Optional[dict]:
+        """Ping Redis and get basic cache statistics in one round trip
+
+        Returns:
+            Same statistics as ``CacheManager.get_cache_stats``, or None if
+            Redis is unreachable
+        """
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.ping()
+                pipe.info()
+                pipe.dbsize()
+                _, info, total_keys = await pipe.execute()
+        except Exception as e:
+            logger.error("Cache stats error", error=str(e))
+            return None
+
+        return {
+            "connected_clients": info.get("connected_clients", 0),
+            "used_memory": info.get("used_memory_human", "0B"),
+            "total_keys": total_keys,
+            "hit_rate": _calculate_hit_rate(info),
+        }
+
+    async def flush_pattern(self, pattern: str) -> int:
+        """Delete keys matching a pattern, scanning rather than blocking on KEYS"""
+        try:
+            deleted = 0
+            batch = []
+            async for key in self.client.scan_iter(match=f"tvdb:{pattern}", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += await self.client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                deleted += await self.client.unlink(*batch)
+            return deleted
+        except Exception as e:
+            logger.error(
+                "Cache flush pattern error",
+                pattern=pattern,
+                error=str(e))
+            return 0
+
+
+# Global cache instances
 cache = CacheManager()
+async_cache = AsyncCacheManager()
+
+
+# In-process copies of hot, read-mostly cache values, kept in front of Redis.
+# Values are stored encoded so every hit hands the caller its own object;
+# callers enrich the returned dicts in place. Series entries expire quickly
+# because other processes may update them in Redis.
+_local_static: TTLCache = TTLCache(maxsize=256, ttl=3600)
+_local_series: TTLCache = TTLCache(maxsize=4096, ttl=60)
+_local_lock = threading.Lock()
+
+
+def _local_get(local: TTLCache, key: Union[str, int]) -> Optional[Any]:
+    """Return a fresh copy of a locally cached value, or None on a miss"""
+    with _local_lock:
+        encoded = local.get(key)
+    return orjson.loads(encoded) if encoded is not None else None
+
+
+def _local_set(local: TTLCache, key: Union[str, int], data: Any):
+    """Keep an encoded copy of a value in a local cache"""
+    encoded = _dumps(data)
+    with _local_lock:
+        local[key] = encoded
+
+
+def _local_pop(local: TTLCache, key: Union[str, int]):
+    with _local_lock:
+        local.pop(key, None)
 
 
 # Cache helper functions for specific TVDB entities
@@ -127,13 +339,24 @@ class TVDBCache:
 
     @staticmethod
     def get_series(series_id: int) -> Optional[dict]:
-        """Get cached series data"""
-        return cache.get("series", series_id)
+        """Get cached series data, checking the in-process copy first"""
+        data = _local_get(_local_series, series_id)
+        if data is None:
+            data = cache.get("series", series_id)
+            if data is not None:
+                _local_set(_local_series, series_id, data)
+        return data
+
+    @staticmethod
+    def get_series_many(series_ids: Iterable[int]) -> List[Optional[dict]]:
+        """Get cached data for several series in one round trip"""
+        return cache.mget("series", series_ids)
 
     @staticmethod
     def set_series(series_id: int, data: dict, extended: bool = False) -> bool:
         """Cache series data with appropriate TTL"""
         ttl = settings.cache_ttl_dynamic_hours if extended else settings.cache_ttl_static_hours
+        _local_pop(_local_series, series_id)
         return cache.set("series", series_id, data, ttl)
 
     @staticmethod
@@ -180,12 +403,21 @@ class TVDBCache:
 
     @staticmethod
     def get_static_data(data_type: str) -> Optional[dict]:
-        """Get cached static data (genres, languages, etc.)"""
-        return cache.get("static", data_type)
+        """Get cached static data (genres, languages, etc.).
+
+        Checks the in-process copy first, so hot lookups skip Redis entirely.
+        """
+        data = _local_get(_local_static, data_type)
+        if data is None:
+            data = cache.get("static", data_type)
+            if data is not None:
+                _local_set(_local_static, data_type, data)
+        return data
 
     @staticmethod
     def set_static_data(data_type: str, data: dict) -> bool:
         """Cache static data with long TTL"""
+        _local_pop(_local_static, data_type)
         return cache.set(
             "static",
             data_type,
@@ -195,6 +427,7 @@ class TVDBCache:
     @staticmethod
     def invalidate_series(series_id: int):
         """Invalidate all related series cache"""
+        _local_pop(_local_series, series_id)
         cache.delete("series", series_id)
         cache.flush_pattern(f"series:{series_id}:*")
 
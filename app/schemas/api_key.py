@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class ApiKeyCreate(BaseModel):
@@ -26,9 +26,9 @@ class ApiKeyCreate(BaseModel):
     pin: Optional[str] = Field(
         None, max_length=20, description="PIN for user-supported keys")
 
-    @validator('name')
+    @field_validator('name')
     @classmethod
-    def validate_name(cls, v):
+    def validate_name(cls, v: str) -> str:
         if not v.strip():
             raise ValueError('Name cannot be empty or whitespace only')
         return v.strip()
@@ -43,15 +43,17 @@ class ApiKeyUpdate(BaseModel):
     requires_pin: Optional[bool] = None
     pin: Optional[str] = Field(None, max_length=20)
 
-    @validator('name')
+    @field_validator('name')
     @classmethod
-    def validate_name(cls, v):
+    def validate_name(cls, v: Optional[str]) -> Optional[str]:
         if v is not None and not v.strip():
             raise ValueError('Name cannot be empty or whitespace only')
         return v.strip() if v else v
 
 
 class ApiKeyResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: str
     description: Optional[str]
@@ -67,17 +69,11 @@ class ApiKeyResponse(BaseModel):
     requires_pin: bool
     has_pin: bool  # Whether a PIN is set (don't expose actual PIN)
 
-    class Config:
-        from_attributes = True
-
 
 class ApiKeyWithKey(ApiKeyResponse):
     """Response that includes the full API key - only for creation"""
     key: str
 
-    class Config:
-        from_attributes = True
-
 
 class ApiKeyList(BaseModel):
     keys: list[ApiKeyResponse]
@@ -86,6 +82,7 @@ class ApiKeyList(BaseModel):
     per_page: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
 
 
 class ApiKeyUsageStats(BaseModel):
@@ -1,21 +1,49 @@
 """Image service for downloading and storing raw images without processing."""
-from typing import Dict, List, Optional
-from urllib.parse import urlparse
+import asyncio
+import re
+from typing import Any, Callable, Dict, List, Optional
 
 import httpx
 import structlog
 
-from app.services.storage import storage
+from app.config import settings
+from app.redis_client import async_redis_client, cache
+from app.services.storage import DELETE_BATCH_SIZE, storage
 
 logger = structlog.get_logger()
 
+# Per-entity Redis hash recording where each image type is stored: image type
+# -> file extension, or "" once a storage probe found nothing. Uploads update
+# it directly; the TTL bounds how long a recorded miss is trusted.
+IMAGE_MANIFEST_TTL_SECONDS = 3600
+
+# Bytes read from the source per chunk while streaming an image into storage
+IMAGE_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Stored image extensions, in the order storage is probed for legacy images,
+# and the content type each is served with
+_IMAGE_EXTENSIONS = ('jpg', 'jpeg', 'png', 'gif', 'webp')
+_CONTENT_TYPES = {
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'webp': 'image/webp'
+}
+
+# Known image extension at the end of a URL's path, before any query/fragment
+_URL_EXTENSION_RE = re.compile(r'[^?#]*\.(jpe?g|png|gif|webp)(?:[?#]|$)', re.IGNORECASE)
+
 
 class ImageService:
     """Service for downloading and managing TVDB images."""
 
     def __init__(self):
+        # HTTP/2 lets concurrent image downloads share one connection per host
         self.http_client = httpx.AsyncClient(
-            timeout=30.0,
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
             follow_redirects=True,
             headers={'User-Agent': 'TVDB-Proxy/1.0'}
         )
@@ -52,12 +80,9 @@ class ImageService:
             File extension (e.g., 'jpg', 'png')
         """
         # Try to get from URL first
-        parsed = urlparse(url)
-        path = parsed.path
-        if '.' in path:
-            ext = path.split('.')[-1].lower()
-            if ext in ['jpg', 'jpeg', 'png', 'gif', 'webp']:
-                return ext
+        match = _URL_EXTENSION_RE.match(url)
+        if match:
+            return match.group(1).lower()
 
         # Try content type
         if content_type:
@@ -73,126 +98,241 @@ class ImageService:
         # Default to jpg
         return 'jpg'
 
-    async def download_image(self, url: str) -> Optional[tuple[bytes, str]]:
-        """Download image from URL.
+    async def download_and_store_image(self, url: str, entity_type: str,
+                                       entity_id: int, image_type: str) -> Optional[str]:
+        """Download and store raw image.
+
+        The image is streamed from the source into storage rather than being
+        read into memory first.
 
         Args:
-            url: Image URL
+            url: Source image URL
+            entity_type: Type of entity
+            entity_id: Entity ID
+            image_type: Type of image
 
         Returns:
-            Tuple of (image bytes, file extension) or None if failed
+            S3 key of stored image or None if failed
         """
         if not url:
             return None
 
         try:
-            response = await self.http_client.get(url)
-            response.raise_for_status()
-
-            # Check content type
-            content_type = response.headers.get('content-type', '')
-            if not content_type.startswith('image/'):
-                logger.warning("Invalid content type for image",
-                               url=url,
-                               content_type=content_type)
-                return None
-
-            # No size limits - store 1:1 raw images regardless of size
-            # Get file extension
-            ext = self._get_file_extension(url, content_type)
-
-            return response.content, ext
+            async with self.http_client.stream("GET", url) as response:
+                response.raise_for_status()
+
+                # Check content type
+                content_type = response.headers.get('content-type', '')
+                if not content_type.startswith('image/'):
+                    logger.warning("Invalid content type for image",
+                                   url=url,
+                                   content_type=content_type)
+                    return None
+
+                # No size limits - store 1:1 raw images regardless of size
+                ext = self._get_file_extension(url, content_type)
+
+                # Generate S3 key with extension
+                base_key = self._get_image_key(entity_type, entity_id, image_type)
+                key = f"{base_key}.{ext}"
+
+                # Upload to storage while the body downloads
+                success = await storage.upload_image_stream(
+                    key=key,
+                    chunks=response.aiter_bytes(IMAGE_STREAM_CHUNK_SIZE),
+                    content_type=_CONTENT_TYPES.get(ext, 'image/jpeg'),
+                    metadata={
+                        'source_url': url,
+                        'entity_type': entity_type,
+                        'entity_id': str(entity_id),
+                        'image_type': image_type
+                    }
+                )
 
         except Exception as e:
             logger.error("Failed to download image", url=url, error=str(e))
             return None
 
-    async def download_and_store_image(self, url: str, entity_type: str,
-                                       entity_id: int, image_type: str) -> Optional[str]:
-        """Download and store raw image.
+        if success:
+            self._record_stored_extension(entity_type, entity_id, image_type, ext)
+            logger.debug("Image stored",
+                         entity_type=entity_type,
+                         entity_id=entity_id,
+                         image_type=image_type,
+                         key=key)
+            return key
+
+        return None
+
+    async def find_image(self, entity_type: str, entity_id: int,
+                         image_type: str) -> Optional[Dict[str, Any]]:
+        """Locate a stored image without downloading it.
 
         Args:
-            url: Source image URL
             entity_type: Type of entity
             entity_id: Entity ID
             image_type: Type of image
 
         Returns:
-            S3 key of stored image or None if failed
+            Dict with ``key``, ``content_type``, ``etag``, ``last_modified``
+            and ``content_length`` or None if not found
         """
-        # Download image
-        result = await self.download_image(url)
-        if not result:
-            logger.warning("Failed to download image", url=url)
+        # Storage and the manifest use blocking clients
+        found = await asyncio.to_thread(
+            self._fetch_stored_image, entity_type, entity_id, image_type, storage.head_image)
+        if found is None:
             return None
 
-        image_bytes, ext = result
+        ext, image_info = found
+        return {
+            "key": f"{entity_type}/{entity_id}/{image_type}.{ext}",
+            "content_type": _CONTENT_TYPES.get(ext, 'image/jpeg'),
+            **image_info,
+        }
 
-        # Generate S3 key with extension
-        base_key = self._get_image_key(entity_type, entity_id, image_type)
-        key = f"{base_key}.{ext}"
+    async def open_image(self, entity_type: str, entity_id: int,
+                         image_type: str) -> Optional[Dict[str, Any]]:
+        """Open a stored image for streaming with a single storage GET.
 
-        # Determine content type
-        content_type_map = {
-            'jpg': 'image/jpeg',
-            'jpeg': 'image/jpeg',
-            'png': 'image/png',
-            'gif': 'image/gif',
-            'webp': 'image/webp'
-        }
-        content_type = content_type_map.get(ext, 'image/jpeg')
-
-        # Upload to storage
-        success = storage.upload_image(
-            key=key,
-            image_data=image_bytes,
-            content_type=content_type,
-            metadata={
-                'source_url': url,
-                'entity_type': entity_type,
-                'entity_id': str(entity_id),
-                'image_type': image_type
-            }
-        )
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity ID
+            image_type: Type of image
 
-        if success:
-            logger.debug("Image stored",
-                         entity_type=entity_type,
-                         entity_id=entity_id,
-                         image_type=image_type,
-                         key=key)
-            return key
+        Returns:
+            Dict with ``key``, ``content_type`` and the fields returned by
+            ``StorageService.stream_image``, or None if not found
+        """
+        # Storage and the manifest use blocking clients
+        found = await asyncio.to_thread(
+            self._fetch_stored_image, entity_type, entity_id, image_type, storage.stream_image)
+        if found is None:
+            return None
 
-        return None
+        ext, image_object = found
+        return {
+            "key": f"{entity_type}/{entity_id}/{image_type}.{ext}",
+            "content_type": _CONTENT_TYPES.get(ext, 'image/jpeg'),
+            **image_object,
+        }
+
+    def _fetch_stored_image(self, entity_type: str, entity_id: int, image_type: str,
+                            fetch: Callable[[str], Optional[Any]]
+                            ) -> Optional[tuple[str, Any]]:
+        """Fetch a stored image under the extension recorded in its manifest.
 
-    async def get_image(self, entity_type: str, entity_id: int,
-                        image_type: str) -> Optional[tuple[bytes, str]]:
-        """Get image from storage.
+        Only images stored before the manifest existed fall back to trying
+        each extension in turn; whatever that finds is recorded for next time.
 
         Args:
             entity_type: Type of entity
             entity_id: Entity ID
             image_type: Type of image
+            fetch: Storage call taking an object key, returning None if absent
 
         Returns:
-            Tuple of (image bytes, content type) or None if not found
+            Tuple of (file extension, fetch result) or None if not stored
         """
-        # Try different extensions
-        for ext in ['jpg', 'jpeg', 'png', 'gif', 'webp']:
-            key = f"{entity_type}/{entity_id}/{image_type}.{ext}"
-            image_data = storage.download_image(key)
-            if image_data:
-                content_type_map = {
-                    'jpg': 'image/jpeg',
-                    'jpeg': 'image/jpeg',
-                    'png': 'image/png',
-                    'gif': 'image/gif',
-                    'webp': 'image/webp'
-                }
-                return image_data, content_type_map.get(ext, 'image/jpeg')
+        recorded = self.get_image_manifest(entity_type, entity_id).get(image_type)
+        if recorded == "":
+            return None
+
+        candidates = [recorded] if recorded else _IMAGE_EXTENSIONS
+        for ext in candidates:
+            result = fetch(f"{entity_type}/{entity_id}/{image_type}.{ext}")
+            if result:
+                if not recorded:
+                    self._record_stored_extension(entity_type, entity_id, image_type, ext)
+                return ext, result
 
+        self._record_stored_extension(entity_type, entity_id, image_type, "")
         return None
 
+    def _manifest_key(self, entity_type: str, entity_id: int) -> str:
+        """Redis key of the stored-image manifest for an entity"""
+        return f"tvdb:img:{entity_type}:{entity_id}"
+
+    def get_image_manifest(self, entity_type: str, entity_id: int) -> Dict[str, str]:
+        """Get the recorded stored-image extensions for an entity.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity ID
+
+        Returns:
+            Dict mapping image types to extension ("" if known to be missing)
+        """
+        try:
+            return cache.client.hgetall(self._manifest_key(entity_type, entity_id))
+        except Exception as e:
+            logger.warning("Image manifest unavailable", error=str(e))
+            return {}
+
+    async def get_image_manifests(self, entity_type: str,
+                                  entity_ids: List[int]) -> Dict[int, Dict[str, str]]:
+        """Get the stored-image manifests of several entities in one round trip.
+
+        Args:
+            entity_type: Type of entity
+            entity_ids: Entity IDs
+
+        Returns:
+            Dict mapping each entity ID to its manifest (empty if none)
+        """
+        try:
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                for entity_id in entity_ids:
+                    pipe.hgetall(self._manifest_key(entity_type, entity_id))
+                manifests = await pipe.execute()
+        except Exception as e:
+            logger.warning("Image manifest unavailable", error=str(e))
+            return {entity_id: {} for entity_id in entity_ids}
+
+        return {
+            entity_id: {field.decode(): ext.decode() for field, ext in manifest.items()}
+            for entity_id, manifest in zip(entity_ids, manifests)
+        }
+
+    def find_image_extension(self, entity_type: str, entity_id: int, image_type: str,
+                             manifest: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """Get the extension an image is stored under, probing storage only once.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity ID
+            image_type: Type of image
+            manifest: Entity manifest from ``get_image_manifest``; updated in
+                place when storage has to be probed
+
+        Returns:
+            File extension or None if the image is not stored
+        """
+        if manifest is None:
+            manifest = self.get_image_manifest(entity_type, entity_id)
+
+        if image_type not in manifest:
+            found = ""
+            for ext in _IMAGE_EXTENSIONS:
+                if storage.image_exists(f"{entity_type}/{entity_id}/{image_type}.{ext}"):
+                    found = ext
+                    break
+            self._record_stored_extension(entity_type, entity_id, image_type, found)
+            manifest[image_type] = found
+
+        return manifest[image_type] or None
+
+    def _record_stored_extension(self, entity_type: str, entity_id: int,
+                                 image_type: str, ext: str):
+        """Record in the manifest where an image is stored ("" for missing)"""
+        key = self._manifest_key(entity_type, entity_id)
+        try:
+            pipe = cache.client.pipeline(transaction=False)
+            pipe.hset(key, image_type, ext)
+            pipe.expire(key, IMAGE_MANIFEST_TTL_SECONDS)
+            pipe.execute()
+        except Exception as e:
+            logger.warning("Image manifest unavailable", error=str(e))
+
     async def sync_entity_images(self, entity_type: str, entity_id: int,
                                  image_urls: Dict[str, str]) -> Dict[str, str]:
         """Sync all images for an entity.
@@ -206,26 +346,28 @@ class ImageService:
             Dict mapping image types to stored S3 keys
         """
         results = {}
+        semaphore = asyncio.Semaphore(settings.image_sync_concurrent_downloads)
+
+        async def sync_one(image_type: str, url: str) -> Optional[str]:
+            async with semaphore:
+                return await self.download_and_store_image(
+                    url, entity_type, entity_id, image_type)
 
-        # Process each image type
-        tasks = []
-        for image_type, url in image_urls.items():
-            if url:
-                task = self.download_and_store_image(url, entity_type, entity_id, image_type)
-                tasks.append((image_type, task))
-
-        # Wait for all downloads to complete
-        for image_type, task in tasks:
-            try:
-                key = await task
-                if key:
-                    results[image_type] = key
-            except Exception as e:
+        # Download and store all images concurrently
+        image_types = [image_type for image_type, url in image_urls.items() if url]
+        keys = await asyncio.gather(
+            *(sync_one(image_type, image_urls[image_type]) for image_type in image_types),
+            return_exceptions=True)
+
+        for image_type, key in zip(image_types, keys):
+            if isinstance(key, Exception):
                 logger.error("Failed to sync image",
                              entity_type=entity_type,
                              entity_id=entity_id,
                              image_type=image_type,
-                             error=str(e))
+                             error=str(key))
+            elif key:
+                results[image_type] = key
 
         return results
 
@@ -258,30 +400,45 @@ class ImageService:
         deleted_count = 0
 
         for entity_type, active_ids in active_entity_ids.items():
-            # List all images for this entity type
-            all_keys = storage.list_images(f"{entity_type}/")
-
-            # Extract entity IDs from keys
             entity_id_set = set(active_ids)
+            orphaned_keys = []
+            orphaned_ids = set()
 
-            for key in all_keys:
+            # Keys are listed page by page and deleted in batches
+            for key in storage.iter_images(f"{entity_type}/"):
                 try:
                     # Parse entity ID from key
-                    parts = key.split('/')
-                    if len(parts) >= 2:
-                        entity_id = int(parts[1])
-
-                        # Delete if entity no longer exists
-                        if entity_id not in entity_id_set:
-                            if storage.delete_image(key):
-                                deleted_count += 1
-
+                    entity_id = int(key.split('/')[1])
                 except (ValueError, IndexError):
                     logger.warning("Invalid image key format", key=key)
+                    continue
+
+                # Delete if entity no longer exists
+                if entity_id not in entity_id_set:
+                    orphaned_keys.append(key)
+                    orphaned_ids.add(entity_id)
+                    if len(orphaned_keys) >= DELETE_BATCH_SIZE:
+                        deleted_count += self._delete_orphans(
+                            entity_type, orphaned_keys, orphaned_ids)
+
+            if orphaned_keys:
+                deleted_count += self._delete_orphans(entity_type, orphaned_keys, orphaned_ids)
 
         logger.info("Cleaned up orphaned images", deleted_count=deleted_count)
         return deleted_count
 
+    def _delete_orphans(self, entity_type: str, keys: List[str], entity_ids: set) -> int:
+        """Delete a batch of orphaned images and their manifests, then clear both"""
+        deleted = storage.delete_images(keys)
+        try:
+            cache.client.unlink(*(self._manifest_key(entity_type, entity_id)
+                                  for entity_id in entity_ids))
+        except Exception as e:
+            logger.warning("Image manifest unavailable", error=str(e))
+        keys.clear()
+        entity_ids.clear()
+        return deleted
+
 
 # Global image service instance
 image_service = ImageService()
@@ -1,5 +1,6 @@
 """Storage service for managing images in S3/Ceph-compatible storage."""
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 import boto3
 import structlog
@@ -9,6 +10,21 @@ from app.config import settings
 
 logger = structlog.get_logger()
 
+# Size of each part of a streamed multipart upload. S3 requires every part
+# but the last to be at least 5 MiB; smaller objects go up in one PUT.
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
+# Most keys S3 accepts in one DeleteObjects request
+DELETE_BATCH_SIZE = 1000
+
+
+def _iter_and_close(body, chunk_size: int) -> Iterator[bytes]:
+    """Yield a response body in chunks, releasing its connection when done"""
+    try:
+        yield from body.iter_chunks(chunk_size)
+    finally:
+        body.close()
+
 
 class StorageService:
     """Service for managing S3/Ceph storage operations."""
@@ -126,6 +142,100 @@ class StorageService:
                          error=str(e))
             return False
 
+    async def upload_image_stream(self, key: str, chunks: AsyncIterator[bytes],
+                                  content_type: str = "image/webp",
+                                  metadata: Optional[Dict[str, str]] = None) -> bool:
+        """Upload an image to S3/Ceph storage as its bytes arrive.
+
+        At most one part is buffered while the previous one uploads, so large
+        images never sit in memory whole. Images smaller than one part are
+        uploaded with a single PUT once the stream ends.
+
+        Args:
+            key: S3 object key
+            chunks: Async iterator of image bytes
+            content_type: MIME type of the image
+            metadata: Optional metadata for the object
+
+        Returns:
+            bool: True if successful
+        """
+        if settings.storage_backend != "s3":
+            return False
+
+        client = self._get_client()
+        if not client:
+            return False
+
+        extra_args = {
+            'ContentType': content_type,
+            'CacheControl': 'public, max-age=86400'  # 24 hours
+        }
+        if metadata:
+            extra_args['Metadata'] = metadata
+
+        upload_id = None
+        parts = []
+        pending = None
+        buffer = bytearray()
+        size = 0
+
+        async def upload_part(data: bytes):
+            part_number = len(parts) + 1
+            response = await asyncio.to_thread(
+                client.upload_part, Bucket=self.bucket_name, Key=key,
+                UploadId=upload_id, PartNumber=part_number, Body=data)
+            parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                size += len(chunk)
+                if len(buffer) < MULTIPART_PART_SIZE:
+                    continue
+
+                if upload_id is None:
+                    response = await asyncio.to_thread(
+                        client.create_multipart_upload,
+                        Bucket=self.bucket_name, Key=key, **extra_args)
+                    upload_id = response['UploadId']
+                if pending is not None:
+                    await pending
+                pending = asyncio.ensure_future(upload_part(bytes(buffer)))
+                buffer.clear()
+
+            if upload_id is None:
+                await asyncio.to_thread(
+                    client.put_object, Bucket=self.bucket_name, Key=key,
+                    Body=bytes(buffer), **extra_args)
+            else:
+                if pending is not None:
+                    await pending
+                    pending = None
+                if buffer:
+                    await upload_part(bytes(buffer))
+                await asyncio.to_thread(
+                    client.complete_multipart_upload, Bucket=self.bucket_name, Key=key,
+                    UploadId=upload_id, MultipartUpload={'Parts': parts})
+
+            logger.debug("Image uploaded", key=key, size=size)
+            return True
+
+        except Exception as e:
+            logger.error("Failed to upload image",
+                         key=key,
+                         error=str(e))
+            if pending is not None:
+                pending.cancel()
+            if upload_id is not None:
+                try:
+                    await asyncio.to_thread(
+                        client.abort_multipart_upload, Bucket=self.bucket_name,
+                        Key=key, UploadId=upload_id)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    pass
+            return False
+
     def download_image(self, key: str) -> Optional[bytes]:
         """Download image from S3/Ceph storage.
 
@@ -159,6 +269,89 @@ class StorageService:
                              error=str(e))
             return None
 
+    def head_image(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get image metadata from S3/Ceph storage without its body.
+
+        Args:
+            key: S3 object key
+
+        Returns:
+            Dict with ``etag``, ``last_modified`` and ``content_length`` or
+            None if not found
+        """
+        if settings.storage_backend != "s3":
+            return None
+
+        try:
+            client = self._get_client()
+            if not client:
+                return None
+
+            response = client.head_object(
+                Bucket=self.bucket_name,
+                Key=key
+            )
+
+            return {
+                "etag": response.get('ETag'),
+                "last_modified": response.get('LastModified'),
+                "content_length": response.get('ContentLength'),
+            }
+
+        except ClientError as e:
+            if e.response['Error']['Code'] != '404':
+                logger.error("Failed to check image existence",
+                             key=key,
+                             error=str(e))
+            return None
+
+    def stream_image(self, key: str,
+                     chunk_size: int = 64 * 1024) -> Optional[Dict[str, Any]]:
+        """Open an image in S3/Ceph storage for chunked reading.
+
+        The validators and length come from the same GET as the body, so
+        they always describe the bytes that are streamed.
+
+        Args:
+            key: S3 object key
+            chunk_size: Bytes per chunk yielded
+
+        Returns:
+            Dict with ``chunks`` (iterator over the image bytes), ``close``
+            (releases the connection if the body is not read), ``etag``,
+            ``last_modified`` and ``content_length`` or None if not found
+        """
+        if settings.storage_backend != "s3":
+            return None
+
+        try:
+            client = self._get_client()
+            if not client:
+                return None
+
+            response = client.get_object(
+                Bucket=self.bucket_name,
+                Key=key
+            )
+
+            body = response['Body']
+            return {
+                "chunks": _iter_and_close(body, chunk_size),
+                "close": body.close,
+                "etag": response.get('ETag'),
+                "last_modified": response.get('LastModified'),
+                "content_length": response.get('ContentLength'),
+            }
+
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                logger.debug("Image not found", key=key)
+            else:
+                logger.error("Failed to download image",
+                             key=key,
+                             error=str(e))
+            return None
+
     def delete_image(self, key: str) -> bool:
         """Delete image from S3/Ceph storage.
 
@@ -190,6 +383,46 @@ class StorageService:
                          error=str(e))
             return False
 
+    def delete_images(self, keys: List[str]) -> int:
+        """Delete several images from S3/Ceph storage in batched requests.
+
+        Args:
+            keys: S3 object keys
+
+        Returns:
+            Number of images deleted
+        """
+        if settings.storage_backend != "s3":
+            return 0
+
+        client = self._get_client()
+        if not client:
+            return 0
+
+        deleted = 0
+        for start in range(0, len(keys), DELETE_BATCH_SIZE):
+            batch = keys[start:start + DELETE_BATCH_SIZE]
+            try:
+                response = client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+            except Exception as e:
+                logger.error("Failed to delete images",
+                             count=len(batch),
+                             error=str(e))
+                continue
+
+            errors = response.get('Errors', [])
+            for error in errors:
+                logger.error("Failed to delete image",
+                             key=error.get('Key'),
+                             error=error.get('Message'))
+            deleted += len(batch) - len(errors)
+
+        logger.debug("Images deleted", count=deleted)
+        return deleted
+
     def image_exists(self, key: str) -> bool:
         """Check if image exists in storage.
 
@@ -256,6 +489,33 @@ class StorageService:
                          error=str(e))
             return []
 
+    def iter_images(self, prefix: str) -> Iterator[str]:
+        """Iterate over every image key with the given prefix, page by page.
+
+        Args:
+            prefix: S3 key prefix (e.g., "series/")
+
+        Yields:
+            Object keys
+        """
+        if settings.storage_backend != "s3":
+            return
+
+        try:
+            client = self._get_client()
+            if not client:
+                return
+
+            paginator = client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                for obj in page.get('Contents', []):
+                    yield obj['Key']
+
+        except Exception as e:
+            logger.error("Failed to list images",
+                         prefix=prefix,
+                         error=str(e))
+
     def get_storage_stats(self) -> Dict[str, Any]:
         """Get storage statistics.
 
@@ -1,5 +1,6 @@
 from typing import Any, Dict, List, Optional
 
+import httpx
 import structlog
 import tvdb_v4_official
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -10,6 +11,37 @@ from app.redis_client import TVDBCache, cache
 logger = structlog.get_logger()
 
 
+class _PooledRequest(tvdb_v4_official.Request):
+    """Request handler for the official client that reuses pooled connections.
+
+    The stock handler opens a new urllib connection, and TLS handshake, for
+    every API call; responses are interpreted the same way.
+    """
+
+    def __init__(self, auth_token: str, http_client: httpx.Client):
+        super().__init__(auth_token)
+        self.http_client = http_client
+
+    def make_request(self, url, if_modified_since=None):
+        headers = {"Authorization": f"Bearer {self.auth_token}"}
+        if if_modified_since:
+            headers["If-Modified-Since"] = str(if_modified_since)
+
+        response = self.http_client.get(url, headers=headers)
+        if response.status_code == 304:
+            return {"code": 304, "message": "Not-Modified"}
+        try:
+            res = response.json()
+        except ValueError:
+            res = {}
+
+        data = res.get("data")
+        if data is not None and res.get("status", "failure") != "failure":
+            self.links = res.get("links")
+            return data
+        raise ValueError(f"failed to get {url}\n  {res.get('message') or 'UNKNOWN FAILURE'}")
+
+
 class TVDBClient:
     """Enhanced TVDB client with caching and error handling"""
 
@@ -17,6 +49,16 @@ class TVDBClient:
         self.client = None
         self.cache = TVDBCache()
         self._authenticated = False
+        # Keep-alive pool shared by all TVDB API calls
+        self.http_client = httpx.Client(
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            headers={'User-Agent': 'TVDB-Proxy/1.0'}
+        )
+
+    def close(self):
+        """Close pooled connections to the TVDB API"""
+        self.http_client.close()
 
     def _get_client(self) -> tvdb_v4_official.TVDB:
         """Get authenticated TVDB client"""
@@ -26,6 +68,8 @@ class TVDBClient:
                     settings.tvdb_api_key,
                     pin=settings.tvdb_pin
                 )
+                self.client.request = _PooledRequest(
+                    self.client.auth.get_token(), self.http_client)
                 self._authenticated = True
                 logger.info("TVDB client authenticated successfully")
             except Exception as e:
@@ -113,10 +157,18 @@ class TVDBClient:
     async def get_series_episodes(self,
                                   series_id: int,
                                   page: int = 0,
+                                  season: Optional[int] = None,
                                   use_cache: bool = True) -> Optional[Dict[str,
                                                                            Any]]:
-        """Get episodes for a series with pagination"""
-        cache_key = f"{series_id}_episodes_page_{page}"
+        """Get episodes for a series with pagination, optionally for one season.
+
+        Returns:
+            Dict with the page's episodes under ``data`` and the API's
+            pagination ``links``, or None if unavailable
+        """
+        cache_key = f"{series_id}_episode_list_page_{page}"
+        if season is not None:
+            cache_key += f"_season_{season}"
 
         if use_cache:
             cached = cache.get("episodes", cache_key)
@@ -129,9 +181,23 @@ class TVDBClient:
 
         try:
             client = self._get_client()
-            episodes_data = client.get_series_episodes(series_id, season_type='default', page=page)
+            if season is None:
+                episodes_data = client.get_series_episodes(
+                    series_id, season_type='default', page=page)
+            else:
+                # The official client has no season argument; the API filters
+                # on the ``season`` query parameter so only that season is sent
+                url = client.url.construct(
+                    'series', series_id, 'episodes/default', page=page, season=season)
+                episodes_data = client.request.make_request(url)
 
             if episodes_data:
+                # make_request returns only the payload and keeps the
+                # pagination links on the request handler
+                episodes_data = {
+                    "data": episodes_data.get("episodes") or [],
+                    "links": getattr(client.request, "links", None) or {},
+                }
                 cache.set(
                     "episodes",
                     cache_key,
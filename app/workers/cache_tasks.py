@@ -1,13 +1,14 @@
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List
 
 import structlog
-from sqlalchemy import desc
+from sqlalchemy import DateTime, Integer, column, desc, func, update, values
 from sqlalchemy.orm import Session
 
+from app.auth import API_KEY_USAGE_LAST_USED, API_KEY_USAGE_REQUESTS
 from app.database import SessionLocal
-from app.models import Episode, Movie, Person, Series
+from app.models import ApiKey, Episode, Movie, Person, Series
 from app.redis_client import cache
 from app.services.tvdb_client import tvdb_client
 from app.workers.celery_app import celery_app
@@ -46,7 +47,7 @@ def cleanup_expired_cache(self):
                 'status': 'Search cache cleaned'})
 
         # Clean up stale episode lists (regenerate from fresh data)
-        cleaned_episodes = cache.flush_pattern("episodes:*_episodes_page_*")
+        cleaned_episodes = cache.flush_pattern("episodes:*_episode_list_page_*")
         self.update_state(
             state='PROGRESS',
             meta={
@@ -94,6 +95,68 @@ def cleanup_expired_cache(self):
         raise
 
 
+@celery_app.task(bind=True)
+def flush_api_key_usage(self):
+    """Write API key usage counted in Redis to the database in one UPDATE"""
+    # Take the pending counters atomically so concurrent requests start afresh
+    pipe = cache.client.pipeline(transaction=True)
+    pipe.hgetall(API_KEY_USAGE_REQUESTS)
+    pipe.hgetall(API_KEY_USAGE_LAST_USED)
+    pipe.delete(API_KEY_USAGE_REQUESTS, API_KEY_USAGE_LAST_USED)
+    requests, last_used, _ = pipe.execute()
+
+    if not requests:
+        return {"status": "completed", "keys_updated": 0}
+
+    rows = [
+        (
+            int(key_id),
+            int(count),
+            datetime.fromtimestamp(int(last_used.get(key_id, 0)), timezone.utc),
+        )
+        for key_id, count in requests.items()
+    ]
+
+    db = get_db_session()
+    try:
+        usage = values(
+            column("id", Integer),
+            column("requests", Integer),
+            column("last_used", DateTime(timezone=True)),
+            name="usage",
+        ).data(rows)
+        db.execute(
+            update(ApiKey)
+            .where(ApiKey.id == usage.c.id)
+            .values(
+                total_requests=ApiKey.total_requests + usage.c.requests,
+                last_used=func.greatest(ApiKey.last_used, usage.c.last_used),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+        logger.info("API key usage flushed", keys_updated=len(rows))
+        return {"status": "completed", "keys_updated": len(rows)}
+
+    except Exception as e:
+        db.rollback()
+        # Put the counts back so the next scheduled run picks them up
+        pipe = cache.client.pipeline(transaction=False)
+        for key_id, count, _ in rows:
+            pipe.hincrby(API_KEY_USAGE_REQUESTS, key_id, count)
+        for key_id, timestamp in last_used.items():
+            pipe.hset(API_KEY_USAGE_LAST_USED, key_id, timestamp)
+        pipe.execute()
+
+        logger.error("API key usage flush failed", error=str(e))
+        self.update_state(state='FAILURE', meta={'error': str(e)})
+        raise
+
+    finally:
+        db.close()
+
+
 @celery_app.task(bind=True)
 def prefetch_popular_content(self):
     """Prefetch popular content to warm up the cache"""
@@ -457,22 +520,17 @@ def _build_series_search_index(db: Session):
     """Build search index for series"""
     series_list = db.query(Series).filter(Series.name.isnot(None)).all()
 
-    for series in series_list:
-        # Create searchable data structure
-        search_data = {
+    # Searchable data keyed by series name, written in pipelined batches
+    cache.mset("search_index", {
+        f"series_{series.name.lower()}": {
             "id": series.tvdb_id,
             "name": series.name,
             "slug": series.slug,
             "year": series.year,
             "type": "series"
         }
-
-        # Cache with series name as key
-        cache.set(
-            "search_index",
-            f"series_{series.name.lower()}",
-            search_data,
-            24)
+        for series in series_list
+    }, 24)
 
     logger.debug("Series search index built", count=len(series_list))
 
@@ -481,20 +539,16 @@ def _build_movie_search_index(db: Session):
     """Build search index for movies"""
     movies_list = db.query(Movie).filter(Movie.name.isnot(None)).all()
 
-    for movie in movies_list:
-        search_data = {
+    cache.mset("search_index", {
+        f"movie_{movie.name.lower()}": {
             "id": movie.tvdb_id,
             "name": movie.name,
             "slug": movie.slug,
             "year": movie.year,
             "type": "movie"
         }
-
-        cache.set(
-            "search_index",
-            f"movie_{movie.name.lower()}",
-            search_data,
-            24)
+        for movie in movies_list
+    }, 24)
 
     logger.debug("Movie search index built", count=len(movies_list))
 
@@ -503,18 +557,14 @@ def _build_people_search_index(db: Session):
     """Build search index for people"""
     people_list = db.query(Person).filter(Person.name.isnot(None)).all()
 
-    for person in people_list:
-        search_data = {
+    cache.mset("search_index", {
+        f"person_{person.name.lower()}": {
             "id": person.tvdb_id,
             "name": person.name,
             "slug": person.slug,
             "type": "person"
         }
-
-        cache.set(
-            "search_index",
-            f"person_{person.name.lower()}",
-            search_data,
-            24)
+        for person in people_list
+    }, 24)
 
     logger.debug("People search index built", count=len(people_list))
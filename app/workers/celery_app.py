@@ -49,6 +49,11 @@ celery_app.conf.beat_schedule = {
         "task": "app.workers.cache_tasks.cleanup_expired_cache",
         "schedule": crontab(minute=0),
     },
+    # API key usage counters flushed to the database every minute
+    "api-key-usage-flush": {
+        "task": "app.workers.cache_tasks.flush_api_key_usage",
+        "schedule": crontab(),
+    },
     # Popular content prefetch every 30 minutes
     "popular-content-prefetch": {
         "task": "app.workers.cache_tasks.prefetch_popular_content",
@@ -61,7 +61,7 @@ done
 
 # Run initial database setup
 echo "🗄️  Setting up database..."
-docker-compose exec api alembic upgrade head
+docker-compose exec api alembic upgrade main@head
 
 echo "🎉 Setup complete!"
 echo ""